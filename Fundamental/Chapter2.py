@@ -0,0 +1,98 @@
+import os
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from core.fundamentals import DATA_DIR, load_store, sample_store
+from core.valuation import simulate
+
+@st.cache_resource
+def get_sample_store():
+    """Synthetic universe used when no statement files are present."""
+    return sample_store(n_companies=2000)
+
+def get_store():
+    # Real files win; load_store reloads them only when they change
+    if os.path.isdir(DATA_DIR):
+        try:
+            return load_store(DATA_DIR), False
+        except FileNotFoundError:
+            pass
+    return get_sample_store(), True
+
+st.header("Chapter 2 - Reading the Financial Statements")
+st.write("The inspector's report on our house comes in three parts: the **Income Statement** (what the business earns), the **Balance Sheet** (what it owns and owes) and the **Cash Flow Statement** (the cash that actually moves). Ratios turn these raw numbers into something you can compare across companies of any size.")
+
+store, is_sample = get_store()
+if is_sample:
+    st.caption(f"Showing a synthetic universe. Drop statement CSVs into `{DATA_DIR}` to use real data.")
+
+st.subheader("Key Ratios", divider=True)
+st.markdown("""
+* **P/E:** Price paid for each unit of earnings.
+* **ROE:** Profit generated on the owners' money.
+* **Debt/Equity:** How much of the house is financed by the bank.
+* **Margins:** How much of every sale is kept as profit.
+* **Growth:** Year-over-year change in revenue and earnings.
+""")
+
+ratios = store.ratios()
+company = st.selectbox("Company", sorted(set(store.companies)))
+st.dataframe(ratios[ratios["company"] == company].set_index("period").drop(columns="company"), use_container_width=True)
+
+st.subheader("What is it Worth? (Intrinsic Value)", divider=True)
+st.write("Back to the House Hunter: the price tag is known, the value is an estimate. Nobody knows the future growth, margins or the right discount rate, so instead of one number we simulate thousands of possible futures and see how often the value ends up above the price.")
+
+row = store.row(company, store.periods[store.companies == company].max())
+revenue = store.column("revenue")[row]
+fcf_margin = ratios["fcf_margin"].iloc[row]
+# A balance sheet without cash or debt lines counts them as none
+net_cash = np.nan_to_num(store.column("cash")[row]) - np.nan_to_num(store.column("total_debt")[row])
+shares = store.column("shares_outstanding")[row]
+price = store.column("price")[row]
+
+if not (np.isfinite([revenue, shares, price]).all() and shares > 0):
+    st.info(f"{company}'s latest period has no revenue, shares outstanding or price, so there is nothing to value.")
+else:
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        growth = st.slider("Revenue Growth (mean)", -0.10, 0.30, 0.06, 0.01)
+        margin = st.slider("FCF Margin (mean)", 0.0, 0.50, float(np.clip(np.nan_to_num(fcf_margin, nan=0.1), 0.0, 0.5)), 0.01)
+        discount = st.slider("Discount Rate (mean)", 0.05, 0.20, 0.09, 0.005)
+        uncertainty = st.slider("Uncertainty", 0.5, 3.0, 1.0, 0.25)
+
+    with col2:
+        result = simulate(revenue, shares, net_cash, price, n_paths=200_000, seed=7,
+                          growth=(growth, 0.04 * uncertainty), margin=(margin, 0.03 * uncertainty),
+                          discount=(discount, 0.015 * uncertainty))
+        p5, p95 = result["percentiles"][5], result["percentiles"][95]
+        counts, edges = np.histogram(np.clip(result["values"], p5, p95), bins=60)
+        fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, marker_color="#00CC96", name="Simulated value"))
+        fig.add_vline(x=price, line=dict(color="red", dash="dash"), annotation_text="Market Price")
+        fig.update_layout(title="Distribution of Intrinsic Value per Share (5th-95th percentile)", height=400,
+                          xaxis_title="Value per Share", yaxis_title="Paths", showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Market Price", f"{price:,.2f}")
+    m2.metric("Median Value", f"{result['percentiles'][50]:,.2f}")
+    m3.metric("Chance Undervalued", f"{result['prob_undervalued']:.0%}")
+
+st.subheader("Screen the Market", divider=True)
+st.write("An inspector can't visit every house in the city, so investors start with a checklist: only look at companies that are cheap, profitable and not drowning in debt. Drag the filters and watch the list shrink.")
+
+@st.fragment
+def screen_market(screener):
+    """Filters and results; moving a slider reruns only this section, not the valuation above."""
+    col1, col2, col3 = st.columns(3)
+    max_pe = col1.slider("P/E below", 5.0, 50.0, 15.0, 0.5)
+    min_roe = col2.slider("ROE above (%)", 0, 50, 20)
+    max_de = col3.slider("Debt/Equity below", 0.0, 3.0, 0.5, 0.05)
+
+    matches = screener.query([("pe", "<", max_pe), ("roe", ">", min_roe / 100), ("debt_to_equity", "<", max_de)],
+                             sort_by="roe", descending=True)
+    st.metric("Companies passing the screen", f"{len(matches):,} of {len(screener):,}")
+    st.dataframe(screener.frame(matches[:100], ["pe", "roe", "debt_to_equity", "net_margin", "revenue_growth"]),
+                 hide_index=True, use_container_width=True)
+
+# Indexes live on the store, so a reload builds new ones and the old ones go with the old store
+screen_market(store.screener())
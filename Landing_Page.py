@@ -1,6 +1,5 @@
 import streamlit as st
-import numpy as np
-import pandas as pd
+from core import prewarm
 
 # Page configuration
 st.set_page_config(
@@ -10,6 +9,9 @@ st.set_page_config(
 )
 
 def home_page():
+    # Optional: import the plotting stack in the background while the learner reads
+    prewarm.start()
+
     st.title("Learn your way to Financial Analysis")
     st.subheader("Select a module to begin")
     st.write("---")
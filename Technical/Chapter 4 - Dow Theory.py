@@ -1,11 +1,14 @@
 import streamlit as st
 import numpy as np
-import pandas as pd
 
 import plotly.graph_objects as go
 
 from plotly.subplots import make_subplots
 
+from core.backtest import backtest
+from core.correlation import correlation_at, leading_order, relative_strength, rolling_correlation, to_returns
+from core.timing import span
+
 
 
 def generate_trends(days=365, primary_slope=0.1, sec_freq=0.05, sec_amp=5, noise_level=1):
@@ -54,6 +57,35 @@ def generate_volume_trend(price, trend_direction=1):
     return np.clip(vol, 100, None)
 
 
+SECTORS = ["Industrials", "Transports", "Materials", "Energy", "Financials", "Technology",
+           "Consumer", "Staples", "Health Care", "Utilities", "Real Estate"]
+
+
+@st.cache_data
+def generate_sector_prices(days=1260, seed=7):
+    """Generates synthetic sector prices driven by a shared market factor plus cyclical and defensive factors."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0003, 0.01, days)
+    cycle = rng.normal(0, 0.006, days)
+    # Cyclical sectors load on the cycle factor, defensive ones against it
+    cyclical = np.array([1.0, 1.2, 0.9, 0.7, 0.6, 0.4, 0.5, -0.4, -0.3, -0.6, 0.1])
+    beta = np.array([1.1, 1.2, 1.0, 0.9, 1.1, 1.3, 1.0, 0.6, 0.7, 0.5, 0.8])
+    noise = rng.normal(0, 0.007, (len(SECTORS), days))
+    returns = beta[:, None] * market + cyclical[:, None] * cycle + noise
+    return 100 * np.cumprod(1 + returns, axis=1)
+
+
+@st.cache_data
+def average_correlation(returns, window, step=5):
+    """Average pairwise correlation through time: high values mean one market, low values mean rotation."""
+    ends, values = [], []
+    n = returns.shape[0]
+    for end, matrix in rolling_correlation(returns, window, step=step):
+        ends.append(end)
+        values.append((matrix.sum() - n) / (n * n - n))
+    return ends, values
+
+
 
 st.title("Dow Theory and application")
 
@@ -150,7 +182,8 @@ with tab3:
             show_minor = st.checkbox("Show Minor (Ripples)", True)
             
         with col2:
-            t, p, s, m, total = generate_trends(days=200, primary_slope=slope, sec_amp=amp, noise_level=noise)
+            with span("generate_trends"):
+                t, p, s, m, total = generate_trends(days=200, primary_slope=slope, sec_amp=amp, noise_level=noise)
             
             fig = go.Figure()
             
@@ -260,6 +293,41 @@ with tab5:
     st.plotly_chart(fig, use_container_width=True)
     st.success(msg)
 
+    st.divider()
+    st.markdown("### Beyond Two Averages: Who Moves Together, Who Leads")
+    st.write("Dow compared two averages, but the same idea works across every sector. Sectors that move together confirm each other; sectors ranked at the top of relative strength are leading the market.")
+
+    sector_prices = generate_sector_prices()
+    sector_returns = to_returns(sector_prices)
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        corr_window = st.slider("Correlation Window (days)", 20, 250, 60, 10)
+        rs_lookback = st.slider("Relative Strength Lookback (days)", 20, 250, 126, 1)
+        as_of = st.slider("As of Day", max(corr_window, rs_lookback), sector_returns.shape[1] - 1, sector_returns.shape[1] - 1)
+
+    with col2:
+        corr = correlation_at(sector_returns, as_of, corr_window)
+        order = leading_order(corr)
+        names = [SECTORS[i] for i in order]
+        fig_corr = go.Figure(go.Heatmap(z=corr[np.ix_(order, order)], x=names, y=names, zmin=-1, zmax=1, colorscale="RdBu"))
+        fig_corr.update_layout(title=f"Sector Correlation ({corr_window}-day window)", height=450)
+        st.plotly_chart(fig_corr, use_container_width=True)
+
+    perf, ranks = relative_strength(sector_prices[:, 1:], rs_lookback)
+    leaders = np.argsort(-perf[:, as_of])
+    fig_rs = go.Figure(go.Bar(x=[SECTORS[i] for i in leaders], y=perf[leaders, as_of] * 100,
+                              customdata=ranks[leaders, as_of] * 100,
+                              hovertemplate="%{x}: %{y:.1f}%<br>Percentile rank %{customdata:.0f}<extra></extra>",
+                              marker_color=['green' if perf[i, as_of] >= 0 else 'red' for i in leaders]))
+    fig_rs.update_layout(title=f"Relative Strength: {rs_lookback}-day Performance (%)", height=350)
+    st.plotly_chart(fig_rs, use_container_width=True)
+
+    ends, avg_corr = average_correlation(sector_returns, corr_window)
+    fig_avg = go.Figure(go.Scatter(x=ends, y=avg_corr, mode='lines', line=dict(color='orange')))
+    fig_avg.add_vline(x=as_of, line=dict(color='gray', dash='dash'))
+    fig_avg.update_layout(title="Average Sector Correlation", height=300, xaxis_title="Day", yaxis_title="Correlation")
+    st.plotly_chart(fig_avg, use_container_width=True)
+
 with tab6:
     st.subheader("Volume Must Confirm the Trend", divider=True)
     st.markdown("""
@@ -282,7 +350,8 @@ with tab6:
     
     # Calculate Volume
     if trend_type == "Healthy Uptrend":
-        vol = generate_volume_trend(price, trend_direction=1)
+        with span("generate_volume_trend"):
+            vol = generate_volume_trend(price, trend_direction=1)
         msg = "✅ **Healthy:** Volume expands as price moves up, and dries up when price pulls back."
     else:
         # Weak Uptrend: Volume decreases as price goes up
@@ -332,4 +401,32 @@ with tab7:
     fig.update_layout(title="Anatomy of a Reversal (Failure Swing)", height=500, xaxis_title="Time", yaxis_title="Price")
     st.plotly_chart(fig, use_container_width=True)
         
-    st.error("The trend is technically UP until the price breaks that red dashed line (The previous Low).")
\ No newline at end of file
+    st.error("The trend is technically UP until the price breaks that red dashed line (The previous Low).")
+
+    st.divider()
+    st.markdown("### Test the Rule")
+    st.write("Go long when price closes above the last swing high, go short when it closes below the last swing low, and hold until the opposite break.")
+    col1, col2 = st.columns([1, 3])
+
+    with col1:
+        pivot_window = st.slider("Swing Window (bars)", 2, 20, 5)
+        confirm_bars = st.slider("Closes Needed to Confirm", 1, 5, 1)
+        allow_short = st.checkbox("Trade Downtrends (Short)", True)
+
+    with col2:
+        with span("backtest"):
+            _, _, _, _, bt_price = generate_trends(days=365, primary_slope=0.05, sec_freq=0.02, sec_amp=10, noise_level=1.5)
+            result = backtest(bt_price, window=pivot_window, confirm_bars=confirm_bars, allow_short=allow_short)
+        bt_t = np.arange(len(bt_price))
+
+        fig_bt = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.05, row_heights=[0.7, 0.3])
+        fig_bt.add_trace(go.Scatter(x=bt_t, y=bt_price, mode='lines', name='Price', line=dict(color='yellow')), row=1, col=1)
+        fig_bt.add_trace(go.Scatter(x=bt_t, y=result["position"][0], mode='lines', name='Position', line=dict(color='orange', shape='hv')), row=2, col=1)
+        fig_bt.update_layout(height=450, title="Trend Following by Pivot Breaks", showlegend=False)
+        st.plotly_chart(fig_bt, use_container_width=True)
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Total Return", f"{result['total_return'][0]:.1%}")
+    m2.metric("Max Drawdown", f"{result['max_drawdown'][0]:.1%}")
+    m3.metric("Hit Rate", f"{result['hit_rate'][0]:.0%}" if result["trades"][0] else "-")
+    m4.metric("Trades", int(result["trades"][0]))
@@ -3,8 +3,11 @@ import streamlit.components.v1 as components
 import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
-from numpy.random import default_rng as rng
-import random as rand
+import time
+import uuid
+from core.indicators import add_overlays
+from core.replay import REPLAY_INDICATORS, ReplayHub, frame_bars, synthetic_bars
+from core.timing import span
 
 def generate_dummy_data(days=100):
     """Generates dummy OHLC data for chart demonstrations."""
@@ -26,7 +29,7 @@ def generate_dummy_data(days=100):
     df = pd.DataFrame(data, columns=['Date', 'Open', 'High', 'Low', 'Close'])
     return df
 
-def plot_candlestick(df, title="Market Structure"):
+def plot_candlestick(df, title="Market Structure", overlays=None):
     fig = go.Figure(data=[go.Candlestick(
         x=df['Date'],
         open=df['Open'],
@@ -35,6 +38,9 @@ def plot_candlestick(df, title="Market Structure"):
         close=df['Close'],
         name="Price"
     )])
+    if overlays:
+        # overlays: {name: series} from core.indicators, e.g. IndicatorSet.get("SMA", window=20)
+        add_overlays(fig, df['Date'], overlays)
     fig.update_layout(
         title=title,
         yaxis_title='Price',
@@ -44,7 +50,7 @@ def plot_candlestick(df, title="Market Structure"):
     )
     return fig
 
-def plot_line(df, title="Line Chart View"):
+def plot_line(df, title="Line Chart View", overlays=None):
     fig = go.Figure(data=[go.Scatter(
         x=df['Date'], 
         y=df['Close'], 
@@ -52,6 +58,8 @@ def plot_line(df, title="Line Chart View"):
         name='Close Price',
         line=dict(color='#00CC96', width=2)
     )])
+    if overlays:
+        add_overlays(fig, df['Date'], overlays)
     fig.update_layout(
         title=title,
         yaxis_title='Price',
@@ -60,6 +68,60 @@ def plot_line(df, title="Line Chart View"):
     )
     return fig
 
+# Endless replays stop here; the chart keeps only this much history anyway
+MAX_REPLAY_BARS = 2000
+
+@st.cache_resource
+def get_replay_hub():
+    """One replay event loop shared by every session on this server."""
+    return ReplayHub()
+
+@st.fragment
+def bar_replay():
+    """
+    Streams bars into a line chart, appending only the new rows. Streaming blocks
+    the script until the replay ends, so it only happens in the fragment's own
+    reruns; a full page run draws the bars so far and returns.
+    """
+    hub = get_replay_hub()
+    if "replay_key" not in st.session_state:
+        st.session_state.replay_key = uuid.uuid4().hex
+    key = st.session_state.replay_key
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        source = st.radio("Bars", ["Historical (Dummy)", "Synthetic (Endless)"])
+        speed = st.slider("Speed (bars/sec)", 1, 20, 5)
+        indicators = st.multiselect("Indicators", list(REPLAY_INDICATORS), default=["SMA 20"])
+        if st.button("Start Replay", type="primary"):
+            bars = frame_bars(generate_dummy_data(250)) if source.startswith("Historical") else synthetic_bars()
+            if hub.start(key, bars, bars_per_second=speed, indicators=indicators, limit=MAX_REPLAY_BARS) is None:
+                st.warning("Too many replays are running right now. Try again in a moment.")
+        if st.button("Stop"):
+            hub.stop(key)
+        live = not st.session_state.get("replay_full_run", False)
+
+    with col2:
+        session = hub.session(key)
+        if session is None:
+            st.info("Press **Start Replay** to watch the chart build bar by bar.")
+            return
+        index, rows = session.rows_since()
+        while live and not rows and not session.done:
+            time.sleep(0.1)
+            index, rows = session.rows_since()
+        if not live and not session.done:
+            st.button("Resume Live View")
+            st.caption("The replay keeps running while the chart is followed; it stops if nobody is watching.")
+        chart = st.line_chart(pd.DataFrame(rows, index=index, columns=session.columns(), dtype=float), height=400)
+        last = index[-1] if index else -1
+        while live and (not session.done or last < session.bar_count - 1):
+            index, rows = session.rows_since(last)
+            if rows:
+                chart.add_rows(pd.DataFrame(rows, index=index, columns=session.columns(), dtype=float))
+                last = index[-1]
+            time.sleep(0.25)
+
 st.title("The Interface (Chart Construction & Setup)")
 st.markdown("""
 Ok! Imagine trying to play **Call of Duty** or **Elder Ring** with your monitor turned off. You're mashing buttons, hoping for the best, but you're flying blind. That is exactly what trading is like without a chart. You are just guessing based on vibes. \n
@@ -86,7 +148,8 @@ Well, the charts are divided into basically 3 types :
 
 tab1, tab2, tab3 = st.tabs(["Time Based Chart", "Price Based Chart", "Volume Based Chart"])
 
-df = generate_dummy_data(100)
+with span("generate_dummy_data"):
+    df = generate_dummy_data(100)
 
 with tab1:
     st.subheader("Time Based Chart")
@@ -102,7 +165,9 @@ with tab1:
         
         Think of the line chart as the "executive summary" of the market. It cuts out all the noise and drama of the day and just tells you the bottom line: where the price ended up. It connects the closing prices with a single, clean line. It's perfect when you want to step back and see the overall trend without getting a headache from too many details. It's not great for timing a precise entry, but it's fantastic for answering the question, "Is this thing generally going up or down?"
         """)
-        st.plotly_chart(plot_line(df), use_container_width=True)
+        with span("plot_line"):
+            fig_line = plot_line(df)
+        st.plotly_chart(fig_line, use_container_width=True)
 
     with tab_2:
         st.write("""
@@ -163,7 +228,9 @@ with tab1:
         **Why Candlesticks Win:**
         They turn a spreadsheet into a narrative. A line chart shows price going up. A candlestick chart might show price going up but struggling, leaving long upper wicks that signal the buyers are running out of ammo. That visual cue of "Exhaustion" is often the only warning you get before a reversal. We will deep dive into specific Candle patterns later—think of them as the Emoji language of the market.
                 """)
-        st.plotly_chart(plot_candlestick(df), use_container_width=True)
+        with span("plot_candlestick"):
+            fig_candle = plot_candlestick(df)
+        st.plotly_chart(fig_candle, use_container_width=True)
     
     with tab_4:
         st.write("The ***Autotune*** for Charts")
@@ -174,3 +241,12 @@ with tab1:
        * In Heikin-Ashi, that same uptrend looks like: Green, Green, Green, Green, Green. It smooths out the red candles during an uptrend to keep you focused on the primary direction.
        **The Verdict:** Excellent for staying in a trend without getting shaken out by minor pullbacks. If the Heikin-Ashi candles are green with no lower wicks, you simply do not sell.
         """)
+
+st.subheader("Bar Replay", divider=True)
+st.write("Charts are easy to read in hindsight. Replay the market one bar at a time and see how the picture (and your indicators) looked while it was still unfolding.")
+# Full page runs must not block in the streaming loop; only the fragment's own reruns stream
+st.session_state.replay_full_run = True
+try:
+    bar_replay()
+finally:
+    st.session_state.replay_full_run = False
@@ -0,0 +1,26 @@
+"""
+Performance benchmarks for the app.
+
+Run from the repository root:
+
+    python -m benchmarks            # run everything and compare with baseline.json
+    python -m benchmarks --update   # run everything and store the results as the new baseline
+    python -m benchmarks --only pages --update "page:Technical/Chapter 4*"
+                                    # re-record only the entries a change affects
+    python -m benchmarks --only micro   # or pages, imports
+    python -m benchmarks --gate all     # also fail on timing and RSS regressions
+
+By default only machine-independent metrics (bytes sent and memory allocated
+per rerun) fail the run. Timings and resident memory depend on the machine
+the baseline was recorded on, so they are printed but not gated unless
+``--gate all`` is given on that machine.
+
+Page benchmarks drive the landing page, both page runners and every chapter
+headlessly with Streamlit's AppTest, each in a fresh interpreter so the cold
+run includes imports. Micro-benchmarks time the chapter helper functions,
+and the import profile replays each entry point's imports under
+``python -X importtime``.
+
+`python -m benchmarks.load` is a separate concurrent-session load test
+against a real server; see benchmarks/load.py.
+"""
@@ -0,0 +1,93 @@
+import argparse
+import fnmatch
+import json
+import os
+import sys
+
+from benchmarks import imports, micro, pages
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Metrics that do not depend on how fast the machine is: what a rerun sends to
+# the browser and allocates. Only these fail the default gate; timings and
+# resident memory are recorded on one box and only reported elsewhere.
+PORTABLE = ("bytes_per_rerun", "rerun_alloc_mb")
+
+# Differences below these are treated as noise whatever the ratio. Page timings
+# include interpreter and Streamlit start-up jitter; micro timings are best-of-N.
+NOISE_FLOOR = {"cold_s": 0.15, "warm_s": 0.025, "import_s": 0.15, "call_s": 1e-5, "_mb": 5.0, "bytes_per_rerun": 1024}
+
+
+def _floor(metric):
+    for suffix, floor in NOISE_FLOOR.items():
+        if metric.endswith(suffix):
+            return floor
+    return 0.0
+
+
+def compare(results, baseline, threshold):
+    """Returns a list of (benchmark, metric, baseline, current) regressions."""
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if base is None:
+                continue
+            if value > base * (1 + threshold) and value - base > _floor(metric):
+                regressions.append((name, metric, base, value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the performance benchmarks.")
+    parser.add_argument("--only", choices=["pages", "micro", "imports"], help="run a single suite")
+    parser.add_argument("--update", nargs="*", metavar="PATTERN",
+                        help="store results as the new baseline; with patterns (e.g. 'page:Technical/Chapter 4*'),"
+                             " only the matching entries are re-recorded")
+    parser.add_argument("--gate", choices=["portable", "all"], default="portable",
+                        help="metrics that fail the run: portable (default) or all, including timings")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown/growth over the baseline (default: 0.25 = 25%%)")
+    parser.add_argument("--reruns", type=int, default=5, help="warm reruns per page (default: 5)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if args.only in (None, "micro"):
+        results.update(micro.run_all())
+    if args.only in (None, "imports"):
+        results.update(imports.run_all())
+    if args.only in (None, "pages"):
+        results.update(pages.run_all(args.reruns))
+
+    for name, metrics in results.items():
+        print(f"{name:<55} " + "  ".join(f"{k}={v:.4g}" for k, v in metrics.items()))
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.update is not None:
+        patterns = args.update or ["*"]
+        updated = {name: m for name, m in results.items() if any(fnmatch.fnmatchcase(name, p) for p in patterns)}
+        if not updated:
+            print("No results match " + ", ".join(patterns))
+            return 1
+        baseline.update(updated)
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Re-recorded {len(updated)} baseline entries in {BASELINE}")
+        return 0
+
+    failed = False
+    for name, metric, base, value in compare(results, baseline, args.threshold):
+        gated = args.gate == "all" or metric in PORTABLE
+        failed = failed or gated
+        label = "REGRESSION" if gated else "slower (not gated)"
+        print(f"{label} {name} {metric}: {base:.4g} -> {value:.4g}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Import-cost profile of every entry point.
+
+The top-level imports of each page and chapter are read from its source and
+replayed in a fresh interpreter under ``python -X importtime``, so the cost
+is measured without running any page code.
+
+    python -m benchmarks.imports        # per entry point, with the heaviest packages
+"""
+import ast
+import glob
+import os
+import subprocess
+import sys
+
+
+def entry_points():
+    files = ["Landing_Page.py"] + sorted(glob.glob(os.path.join("pages", "*.py")))
+    for folder in ("Fundamental", "Technical"):
+        files += sorted(f for f in glob.glob(os.path.join(folder, "*.py")) if not f.endswith("__init__.py"))
+    return files
+
+
+def import_statements(path):
+    """Source of the module-level import statements of `path`."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source, filename=path)
+    return [
+        ast.get_source_segment(source, node)
+        for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+
+
+def _importtime(code):
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return proc.stderr.splitlines()
+
+
+_startup = None
+
+
+def _startup_modules():
+    """Modules the interpreter imports before any user code (site, encodings, ...)."""
+    global _startup
+    if _startup is None:
+        _startup = {
+            line.split("|")[-1].strip()
+            for line in _importtime("pass") if line.startswith("import time:")
+        }
+    return _startup
+
+
+def profile(path):
+    """Returns (total seconds, [(package, cumulative seconds)]) for the imports of `path`."""
+    code = "\n".join(import_statements(path)) or "pass"
+    try:
+        lines = _importtime(code)
+    except RuntimeError as e:
+        raise RuntimeError(f"{path}: {e}") from None
+    startup = _startup_modules()
+    packages = []
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only top-level imports; nested ones are included in their cumulative time
+        if name.startswith("  ") or name.strip() in startup:
+            continue
+        packages.append((name.strip(), int(cumulative) / 1e6))
+    return sum(t for _, t in packages), sorted(packages, key=lambda p: -p[1])
+
+
+def run_all():
+    return {f"imports:{path}": {"import_s": profile(path)[0]} for path in entry_points()}
+
+
+if __name__ == "__main__":
+    for path in entry_points():
+        total, packages = profile(path)
+        heaviest = ", ".join(f"{name} {t * 1000:.0f}ms" for name, t in packages[:3])
+        print(f"{path:<48} {total * 1000:8.1f} ms   {heaviest}")
@@ -0,0 +1,229 @@
+"""
+Concurrent-session load test.
+
+Starts the app with ``streamlit run`` and drives it with a thread pool of
+headless learners. Each learner is a real websocket session speaking
+Streamlit's protocol, so script runs, session_state and per-session figures
+live in the server process just as they do for browsers. A learner opens the
+landing page, moves to the Technical page, clicks "Next Chapter →" through
+every chapter and, on Dow Theory, moves the Tenet 2 sliders.
+
+    python -m benchmarks.load --sessions 50
+
+Reports throughput, rerun latency percentiles and server resident memory per
+connected session. Run it with increasing --sessions to see where a single
+process saturates. AppTest is not used here: it keeps global runtime state
+and cannot run sessions concurrently.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+DONE = (ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_WITH_COMPILE_ERROR)
+
+# Tenet 2 simulation sliders in Chapter 4 and the values a learner tries
+TENET_2_MOVES = [
+    ("Primary Trend Slope (Bull/Bear)", [-0.1]),
+    ("Secondary Trend Volatility", [12]),
+    ("Minor Trend Noise", [3.0]),
+]
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _rss_mb(pid):
+    """Current resident set size of `pid` (Linux /proc; None elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+
+def start_server(port):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "Landing_Page.py",
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false", "--server.fileWatcherType", "none"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Streamlit server did not start")
+
+
+class Learner:
+    """One websocket session; every `rerun` waits for the script run to finish."""
+
+    def __init__(self, port):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.conn = None
+        self.page_hash = ""
+        self.widgets = {}
+        self.latencies = []
+        self.bytes = 0
+
+    async def connect(self):
+        self.conn = await websocket_connect(self.url, max_message_size=256 * 1024 * 1024)
+
+    async def rerun(self, widget_states=()):
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = self.page_hash
+        for state in widget_states:
+            msg.rerun_script.widget_states.widgets.append(state)
+        start = time.perf_counter()
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            raw = await self.conn.read_message()
+            if raw is None:
+                raise ConnectionError("server closed the session")
+            self.bytes += len(raw)
+            fwd = ForwardMsg.FromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self.widgets = {}
+            elif kind == "navigation":
+                # The page actually run, e.g. after st.switch_page
+                self.page_hash = fwd.navigation.page_script_hash
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                widget = getattr(element, element.WhichOneof("type"))
+                if hasattr(widget, "label") and getattr(widget, "id", ""):
+                    self.widgets[widget.label] = widget.id
+            elif kind == "script_finished" and fwd.script_finished in DONE:
+                break
+        self.latencies.append(time.perf_counter() - start)
+
+    async def click(self, label):
+        state = BackMsg().rerun_script.widget_states.widgets.add()
+        state.id = self.widgets[label]
+        state.trigger_value = True
+        await self.rerun(widget_states=[state])
+
+    async def slide(self, label, value):
+        state = BackMsg().rerun_script.widget_states.widgets.add()
+        state.id = self.widgets[label]
+        state.double_array_value.data.extend(value)
+        await self.rerun(widget_states=[state])
+
+    async def visit(self, think_time):
+        await self.connect()
+        await self.rerun()
+        await asyncio.sleep(think_time)
+        await self.click("Start Technical")
+        while "Next Chapter →" in self.widgets:
+            await asyncio.sleep(think_time)
+            await self.click("Next Chapter →")
+            if "Primary Trend Slope (Bull/Bear)" in self.widgets:
+                for label, value in TENET_2_MOVES:
+                    await asyncio.sleep(think_time)
+                    await self.slide(label, value)
+
+
+def run_learner(port, think_time, connected, hold):
+    """Thread-pool task: runs one learner on its own event loop and keeps it open until `hold` is set."""
+    learner = Learner(port)
+
+    async def session():
+        try:
+            await learner.visit(think_time)
+        finally:
+            connected.release()
+        while not hold.is_set():
+            await asyncio.sleep(0.1)
+        learner.conn.close()
+
+    asyncio.run(session())
+    return learner
+
+
+def _pct(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent learners (default: 20)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds between a learner's clicks")
+    parser.add_argument("--port", type=int, default=None, help="use an already running server on this port")
+    parser.add_argument("--pid", type=int, default=None, help="server pid for memory readings with --port")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.port is None:
+        port = _free_port()
+        server = start_server(port)
+        pid = server.pid
+    else:
+        port, pid = args.port, args.pid
+
+    try:
+        # Warm the server with one learner so imports are not billed to the cohort
+        warm = threading.Semaphore(0)
+        warm_hold = threading.Event()
+        warm_hold.set()
+        run_learner(port, 0, warm, warm_hold)
+        idle_rss = _rss_mb(pid) if pid else None
+
+        # Sessions stay connected until all have finished, so each gets its own thread
+        connected = threading.Semaphore(0)
+        hold = threading.Event()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+            futures = [pool.submit(run_learner, port, args.think_time, connected, hold)
+                       for _ in range(args.sessions)]
+            for _ in range(args.sessions):
+                connected.acquire()
+            elapsed = time.perf_counter() - start
+            # Every learner has finished its walk and is still connected
+            loaded_rss = _rss_mb(pid) if pid else None
+            hold.set()
+            learners = [f.result() for f in futures]
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies = [lat for learner in learners for lat in learner.latencies]
+    print(f"sessions            {args.sessions}")
+    print(f"reruns              {len(latencies)}")
+    print(f"throughput          {len(latencies) / elapsed:.1f} reruns/s")
+    print(f"latency p50         {_pct(latencies, 0.50) * 1000:.1f} ms")
+    print(f"latency p95         {_pct(latencies, 0.95) * 1000:.1f} ms")
+    print(f"latency p99         {_pct(latencies, 0.99) * 1000:.1f} ms")
+    print(f"latency max         {max(latencies) * 1000:.1f} ms")
+    print(f"bytes per rerun     {sum(lr.bytes for lr in learners) / len(latencies):.0f}")
+    if idle_rss is not None and loaded_rss is not None:
+        print(f"server rss idle     {idle_rss:.1f} MB")
+        print(f"server rss loaded   {loaded_rss:.1f} MB")
+        print(f"rss per session     {(loaded_rss - idle_rss) / args.sessions:.2f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("STREAMLIT_BROWSER_GATHER_USAGE_STATS", "false")
+    sys.exit(main())
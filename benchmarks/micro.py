@@ -0,0 +1,59 @@
+"""Micro-benchmarks for the chapter helper functions."""
+import ast
+import timeit
+
+CHAPTER_4 = "Technical/Chapter 4 - Dow Theory.py"
+CHAPTER_5 = "Technical/Chapter 5 - Chart.py"
+
+
+def load_functions(path, names):
+    """
+    Returns the named top-level functions of a chapter without running its page
+    code: only the imports and the requested definitions are executed.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    keep = [
+        node for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        or (isinstance(node, ast.FunctionDef) and node.name in names)
+    ]
+    namespace = {"__name__": "benchmarked_chapter"}
+    exec(compile(ast.Module(body=keep, type_ignores=[]), path, "exec"), namespace)
+    return [namespace[name] for name in names]
+
+
+def cases():
+    """name -> zero-argument callable."""
+    import numpy as np
+
+    generate_trends, generate_volume_trend = load_functions(
+        CHAPTER_4, ["generate_trends", "generate_volume_trend"])
+    generate_dummy_data, plot_candlestick, plot_line = load_functions(
+        CHAPTER_5, ["generate_dummy_data", "plot_candlestick", "plot_line"])
+
+    from core.fundamentals import sample_store
+    from core.screener import Screener
+
+    price = 100 + np.arange(100) + 5 * np.sin(np.arange(100) * 0.2)
+    df = generate_dummy_data(100)
+    screener = Screener.from_store(sample_store(n_companies=50_000))
+    return {
+        "generate_trends": lambda: generate_trends(days=200),
+        "generate_volume_trend": lambda: generate_volume_trend(price, trend_direction=1),
+        "generate_dummy_data": lambda: generate_dummy_data(100),
+        "plot_candlestick": lambda: plot_candlestick(df),
+        "plot_line": lambda: plot_line(df),
+        "screener_query_50k": lambda: screener.query("pe < 15 and roe > 20% and debt_to_equity < 0.5"),
+    }
+
+
+def run_all(repeat=5):
+    """Best per-call time over `repeat` auto-ranged rounds, in seconds."""
+    results = {}
+    for name, func in cases().items():
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[f"micro:{name}"] = {"call_s": best}
+    return results
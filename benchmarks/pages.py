@@ -0,0 +1,110 @@
+"""Headless rerun benchmarks for the landing page, page runners and chapters."""
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from unittest import mock
+
+from core.chapters import MODULES, chapter_files
+
+
+def targets():
+    """Every entry point: the landing page, both runners and each chapter via its runner."""
+    names = ["Landing_Page.py"] + [page for page, _ in MODULES.values()]
+    for folder in MODULES:
+        names += [f"{folder}/{chapter}" for chapter in chapter_files(folder)]
+    return names
+
+
+def _app(target):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.abspath("Landing_Page.py"), default_timeout=120)
+    if target == "Landing_Page.py":
+        return at
+    folder, _, chapter = target.partition("/")
+    if folder in MODULES:
+        page, selector = MODULES[folder]
+        at.session_state[selector] = chapter
+        return at.switch_page(page)
+    return at.switch_page(target)
+
+
+def _peak_rss_mb():
+    # VmHWM starts afresh at exec; ru_maxrss would carry over the parent's peak
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def measure(target, reruns=5):
+    """Runs one target in this process and returns its metrics."""
+    from streamlit.testing.v1 import local_script_runner
+
+    sizes = []
+    parse = local_script_runner.parse_tree_from_messages
+
+    def counting_parse(messages):
+        sizes.append(sum(m.ByteSize() for m in messages))
+        return parse(messages)
+
+    with mock.patch.object(local_script_runner, "parse_tree_from_messages", counting_parse):
+        start = time.perf_counter()
+        at = _app(target)
+        at.run()
+        cold = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(f"{target}: {at.exception[0].message}")
+
+        warm = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            at.run()
+            warm.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        at.run()
+        _, rerun_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "cold_s": cold,
+        "warm_s": min(warm),
+        "peak_rss_mb": _peak_rss_mb(),
+        "rerun_alloc_mb": rerun_peak / (1024 * 1024),
+        "bytes_per_rerun": statistics.median(sizes[1:]),
+    }
+
+
+def run_all(reruns=5):
+    """Measures every target in its own interpreter so cold runs pay the imports."""
+    results = {}
+    # Next-chapter prefetch would charge the following chapter to this one
+    env = dict(os.environ, APP_PREFETCH_BUDGET="0")
+    for target in targets():
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.pages", target, str(reruns)],
+            capture_output=True, text=True, env=env,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{target} failed:\n{proc.stderr[-2000:]}")
+        results[f"page:{target}"] = json.loads(proc.stdout.strip().splitlines()[-1])
+    return results
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.WARNING)
+    print(json.dumps(measure(sys.argv[1], int(sys.argv[2]))))
@@ -0,0 +1 @@
+"""Shared analytics used by the chapter scripts under Fundamental/ and Technical/."""
@@ -0,0 +1,193 @@
+"""
+Dow Theory Tenet 6 backtester: "a trend is assumed to be in effect until it
+gives a definite signal of reversal".
+
+Swing highs and lows (pivots) are found with a centred rolling window. A
+close above the last confirmed swing high turns the trend up, a close below
+the last confirmed swing low turns it down, and the position is held until
+the opposite break. Prices are a 1-D series or a (symbols x time) array;
+every step works on all symbols at once.
+
+`sweep` runs a grid of parameters over a process pool. The price matrix is
+placed in shared memory once and every worker maps it, so it is never
+pickled per task.
+"""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _as_2d(prices):
+    arr = np.asarray(prices, dtype=float)
+    return arr[np.newaxis, :] if arr.ndim == 1 else arr
+
+
+def _ffill(values, mask):
+    """Carries values[mask] forward along the time axis; NaN before the first hit."""
+    idx = np.where(mask, np.arange(values.shape[1]), 0)
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    filled = np.take_along_axis(values, idx, axis=1)
+    seen = np.logical_or.accumulate(mask, axis=1)
+    return np.where(seen, filled, np.nan)
+
+
+def find_pivots(prices, window=5):
+    """
+    Returns boolean (pivot_high, pivot_low) masks. Bar t is a pivot when it is the
+    extreme of the 2 * window + 1 bars centred on it, so it is only known at t + window.
+    """
+    x = _as_2d(prices)
+    highs = np.zeros(x.shape, dtype=bool)
+    lows = np.zeros(x.shape, dtype=bool)
+    span = 2 * window + 1
+    if x.shape[1] >= span:
+        view = sliding_window_view(x, span, axis=1)
+        centre = x[:, window:x.shape[1] - window]
+        highs[:, window:x.shape[1] - window] = centre == view.max(axis=2)
+        lows[:, window:x.shape[1] - window] = centre == view.min(axis=2)
+    return highs, lows
+
+
+def _shift(mask, n):
+    """Shifts a boolean mask `n` bars later in time."""
+    out = np.zeros_like(mask)
+    if n < mask.shape[1]:
+        out[:, n:] = mask[:, :mask.shape[1] - n]
+    return out
+
+
+def _consecutive(mask, n):
+    """True where `mask` has held for the last `n` bars."""
+    if n <= 1:
+        return mask
+    out = mask.copy()
+    for k in range(1, n):
+        out &= _shift(mask, k)
+    return out
+
+
+def dow_positions(prices, window=5, confirm_bars=1, allow_short=True):
+    """
+    Turns pivot breaks into positions: +1 long, -1 short (0 when `allow_short` is off).
+
+    window       -- bars either side of a swing high/low
+    confirm_bars -- consecutive closes beyond the pivot needed for a definite signal
+    """
+    x = _as_2d(prices)
+    highs, lows = find_pivots(x, window)
+    # A pivot only becomes usable once the bars to its right have printed
+    known_high = _ffill(x, highs)
+    known_low = _ffill(x, lows)
+    resistance = np.full(x.shape, np.nan)
+    support = np.full(x.shape, np.nan)
+    resistance[:, window:] = known_high[:, :x.shape[1] - window]
+    support[:, window:] = known_low[:, :x.shape[1] - window]
+
+    up = _consecutive(x > resistance, confirm_bars)
+    down = _consecutive(x < support, confirm_bars)
+    signal = np.where(up, 1.0, np.where(down, -1.0, 0.0))
+    position = np.nan_to_num(_ffill(signal, signal != 0))
+    if not allow_short:
+        np.clip(position, 0, None, out=position)
+    return position
+
+
+def performance(prices, position):
+    """Returns a dict of per-symbol arrays: total return, max drawdown, hit rate, trades."""
+    x = _as_2d(prices)
+    pos = _as_2d(position)
+    returns = np.zeros(x.shape)
+    returns[:, 1:] = x[:, 1:] / x[:, :-1] - 1.0
+    # Trade on the close of the signal bar, earn the next bar's return
+    held = np.zeros(x.shape)
+    held[:, 1:] = pos[:, :-1]
+    strat = held * returns
+
+    equity = np.cumprod(1.0 + strat, axis=1)
+    peak = np.maximum.accumulate(equity, axis=1)
+    drawdown = equity / peak - 1.0
+
+    # A trade is a run of identical non-zero positions
+    log_eq = np.log(equity)
+    n_symbols = x.shape[0]
+    hit_rate = np.full(n_symbols, np.nan)
+    trades = np.zeros(n_symbols, dtype=int)
+    for i in range(n_symbols):
+        change = np.flatnonzero(np.diff(held[i], prepend=0.0))
+        bounds = np.append(change, x.shape[1])
+        sides = held[i, change]
+        starts, ends = bounds[:-1][sides != 0], bounds[1:][sides != 0]
+        if len(starts):
+            pnl = log_eq[i, ends - 1] - np.where(starts > 0, log_eq[i, starts - 1], 0.0)
+            trades[i] = len(pnl)
+            hit_rate[i] = np.mean(pnl > 0)
+
+    return {
+        "total_return": equity[:, -1] - 1.0,
+        "max_drawdown": drawdown.min(axis=1),
+        "hit_rate": hit_rate,
+        "trades": trades,
+        "equity": equity,
+    }
+
+
+def backtest(prices, window=5, confirm_bars=1, allow_short=True):
+    """Runs the Tenet 6 rule and returns `performance` plus the positions."""
+    position = dow_positions(prices, window, confirm_bars, allow_short)
+    result = performance(prices, position)
+    result["position"] = position
+    return result
+
+
+# Worker side of `sweep`: each process maps the shared price matrix once
+_shared = {}
+
+
+def _attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    _shared["shm"] = shm
+    _shared["prices"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _summary(prices, params):
+    result = backtest(prices, **params)
+    result.pop("equity")
+    result.pop("position")
+    return params, result
+
+
+def _run_params(params):
+    return _summary(_shared["prices"], params)
+
+
+def param_grid(**options):
+    """Expands lists of values into a list of parameter dicts."""
+    keys = list(options)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*options.values())]
+
+
+def sweep(prices, grid, max_workers=None):
+    """
+    Backtests every parameter dict in `grid` over a process pool and returns a list
+    of (params, summary) pairs in grid order. Uses all cores by default.
+    """
+    x = np.ascontiguousarray(_as_2d(prices))
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(grid) == 1:
+        # In process: no shared state, so concurrent sessions cannot see each other's prices
+        return [_summary(x, p) for p in grid]
+
+    shm = shared_memory.SharedMemory(create=True, size=x.nbytes)
+    try:
+        np.ndarray(x.shape, dtype=x.dtype, buffer=shm.buf)[:] = x
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach,
+                                 initargs=(shm.name, x.shape, x.dtype.str)) as pool:
+            chunksize = max(1, len(grid) // (4 * max_workers))
+            return list(pool.map(_run_params, grid, chunksize=chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,41 @@
+"""
+Chapter manifest: which chapter scripts exist and in what order.
+
+Mirrors the page runners: every ``.py`` file in a module folder except
+``__init__.py`` is a chapter, sorted by file name, and its display name is
+the file name without the extension.
+"""
+import os
+
+# Module folder -> (runner page script, session_state key of the selected chapter)
+MODULES = {
+    "Fundamental": ("pages/1_Fundamentals.py", "fund_chapter_selector"),
+    "Technical": ("pages/2_Technical.py", "tech_chapter_selector"),
+}
+
+
+def chapter_files(folder):
+    """Ordered {chapter name: file name} for a module folder."""
+    files = sorted(f for f in os.listdir(folder) if f.endswith(".py") and f != "__init__.py")
+    return {f.replace(".py", ""): f for f in files}
+
+
+def manifest(root="."):
+    """Yields (module folder, chapter name, path) for every chapter in reading order."""
+    for folder in MODULES:
+        path = os.path.join(root, folder)
+        if not os.path.isdir(path):
+            continue
+        for name, filename in chapter_files(path).items():
+            yield folder, name, os.path.join(path, filename)
+
+
+def page_url(folder, chapter=None, app_url=""):
+    """Link into the live app, opening `chapter` through the runner's ?chapter= parameter."""
+    from urllib.parse import quote
+
+    page = os.path.splitext(os.path.basename(MODULES[folder][0]))[0].split("_", 1)[1]
+    url = f"{app_url.rstrip('/')}/{page}"
+    if chapter:
+        url += "?chapter=" + quote(chapter)
+    return url
@@ -0,0 +1,117 @@
+"""
+Rolling correlation matrices and relative-strength rankings over a
+(symbols x time) matrix.
+
+The rolling correlation keeps the window sums S = sum(x) and
+Q = sum(x x^T) and slides them: add the new bars, drop the oldest. Moving
+`step` bars at once turns both updates into one matrix product each. Sums
+are rebuilt from scratch every `rebase` steps to stop floating-point drift.
+Matrices are produced as a generator over the time axis, so 500 symbols
+over 20 years never need more than one window plus one output in memory.
+"""
+import numpy as np
+
+
+def to_returns(prices):
+    """Simple returns along the time axis; the result has one bar fewer."""
+    prices = np.asarray(prices, dtype=float)
+    return prices[:, 1:] / prices[:, :-1] - 1.0
+
+
+def _corr_from_sums(s, q, n):
+    mean = s / n
+    cov = q / n - np.outer(mean, mean)
+    std = np.sqrt(np.clip(np.diag(cov), 0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.outer(std, std)
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, 1.0)
+    return corr
+
+
+def correlation_at(returns, end, window):
+    """Correlation matrix of the `window` bars ending at bar `end` (inclusive)."""
+    block = np.asarray(returns, dtype=float)[:, end - window + 1:end + 1]
+    return _corr_from_sums(block.sum(axis=1), block @ block.T, block.shape[1])
+
+
+def rolling_correlation(returns, window, step=1, rebase=250):
+    """
+    Yields (end bar, correlation matrix) for windows ending at window-1, window-1+step, ...
+    Each advance costs O(symbols^2 * step) instead of O(symbols^2 * window).
+    """
+    x = np.asarray(returns, dtype=float)
+    n_time = x.shape[1]
+    if n_time < window:
+        return
+    end = window - 1
+    block = x[:, :window]
+    s, q = block.sum(axis=1), block @ block.T
+    advances = 0
+    while True:
+        yield end, _corr_from_sums(s, q, window)
+        if end + step >= n_time:
+            return
+        new = x[:, end + 1:end + 1 + step]
+        old = x[:, end + 1 - window:end + 1 - window + step]
+        end += step
+        advances += 1
+        if advances % rebase == 0:
+            block = x[:, end - window + 1:end + 1]
+            s, q = block.sum(axis=1), block @ block.T
+        else:
+            s += new.sum(axis=1) - old.sum(axis=1)
+            q += new @ new.T - old @ old.T
+
+
+class RollingCorrelation:
+    """Streaming version: `update` takes one bar for every symbol in O(symbols^2)."""
+
+    def __init__(self, n_symbols, window):
+        self.window = window
+        self._ring = np.zeros((window, n_symbols))
+        self._s = np.zeros(n_symbols)
+        self._q = np.zeros((n_symbols, n_symbols))
+        self._count = 0
+
+    def update(self, bar):
+        bar = np.asarray(bar, dtype=float)
+        slot = self._count % self.window
+        old = self._ring[slot]
+        self._s += bar - old
+        self._q += np.outer(bar, bar) - np.outer(old, old)
+        self._ring[slot] = bar
+        self._count += 1
+        if self._count < self.window:
+            return None
+        return _corr_from_sums(self._s, self._q, self.window)
+
+
+def relative_strength(prices, lookback, chunk=2000):
+    """
+    Returns (performance, percentile rank) arrays shaped like `prices`: each
+    symbol's return over `lookback` bars and its cross-sectional rank at that
+    bar (1.0 = strongest). Symbols without a price at either end (not listed
+    yet, delisted) get NaN and are left out of that bar's ranking. Ranks are
+    computed `chunk` bars at a time.
+    """
+    prices = np.asarray(prices, dtype=float)
+    n_time = prices.shape[1]
+    perf = np.full(prices.shape, np.nan)
+    perf[:, lookback:] = prices[:, lookback:] / prices[:, :-lookback] - 1.0
+    ranks = np.full(prices.shape, np.nan)
+    for start in range(lookback, n_time, chunk):
+        block = perf[:, start:start + chunk]
+        valid = np.isfinite(block)
+        # Invalid entries sort after every finite one, so valid ranks run 1..count
+        order = np.argsort(np.argsort(np.where(valid, block, np.inf), axis=0), axis=0)
+        count = valid.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ranks[:, start:start + chunk] = np.where(valid, (order + 1) / count, np.nan)
+    return perf, ranks
+
+
+def leading_order(corr):
+    """Symbol order along the leading eigenvector, so correlated blocks sit together in a heatmap."""
+    _, vectors = np.linalg.eigh(np.nan_to_num(corr))
+    return np.argsort(vectors[:, -1])
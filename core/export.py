@@ -0,0 +1,201 @@
+"""
+Static pre-render of every chapter.
+
+Each chapter in the manifest is run once headlessly with its default
+parameters (Streamlit's AppTest). The resulting element tree is written out
+as plain HTML: markdown is rendered in the browser, Plotly figures are
+embedded as JSON, and widgets become links back into the live app. The output
+folder can be served by any static file server, so read-only visitors never
+open a Streamlit session.
+
+    python -m core.export --out site --app-url https://learn.example.com
+
+Without ``--app-url`` the pages carry no links into the live app, since
+the static server cannot answer them.
+"""
+import argparse
+import html
+import logging
+import os
+import re
+
+from core.chapters import manifest, page_url
+
+PLOTLY_JS = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+MARKED_JS = "https://cdn.jsdelivr.net/npm/marked@12/marked.min.js"
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<script src="{plotly}"></script>
+<script src="{marked}"></script>
+<style>
+body {{ font-family: "Source Sans Pro", sans-serif; max-width: 860px; margin: 2rem auto; padding: 0 1rem; line-height: 1.6; }}
+nav {{ display: flex; justify-content: space-between; margin: 1rem 0 2rem; }}
+.tab {{ border-top: 1px solid #ddd; margin-top: 2rem; }}
+.tab-label {{ color: #ff4b4b; }}
+.row {{ display: flex; gap: 1.5rem; }}
+.row > div {{ flex: 1; min-width: 0; }}
+.alert {{ padding: 0.8rem 1rem; border-radius: 0.5rem; margin: 1rem 0; }}
+.info {{ background: #e8f1fb; }} .success {{ background: #e6f4ea; }}
+.error {{ background: #fdecea; }} .warning {{ background: #fff8e1; }}
+.widget {{ font-size: 0.9rem; color: #555; }}
+.caption {{ font-size: 0.85rem; color: #777; }}
+.metric b {{ display: block; font-size: 1.6rem; }}
+iframe {{ width: 100%; border: none; }}
+</style>
+</head>
+<body>
+{body}
+<script>
+document.querySelectorAll("script.md").forEach(function (el) {{
+  var div = document.createElement("div");
+  div.innerHTML = marked.parse(el.textContent);
+  el.replaceWith(div);
+}});
+document.querySelectorAll("script.figure").forEach(function (el) {{
+  var spec = JSON.parse(el.textContent);
+  var div = document.createElement("div");
+  el.replaceWith(div);
+  Plotly.newPlot(div, spec.data, spec.layout, {{responsive: true}});
+}});
+</script>
+</body>
+</html>
+"""
+
+WIDGETS = {"slider", "checkbox", "radio", "selectbox", "multiselect", "button"}
+ALERTS = {"info", "success", "error", "warning"}
+
+
+def _script(cls, text, kind="text/plain"):
+    # Keep a literal "</script>" inside the payload from closing the tag
+    payload = re.sub(r"</(script)", r"<\\/\1", text, flags=re.IGNORECASE)
+    return f'<script type="{kind}" class="{cls}">{payload}</script>'
+
+
+def _markdown(text):
+    return _script("md", text, "text/markdown")
+
+
+class _Renderer:
+    def __init__(self, live_url):
+        self.live_url = live_url
+        self.widgets_seen = False
+
+    def render(self, node):
+        kind = node.type
+        children = getattr(node, "children", None)
+        if kind == "tab":
+            return f'<section class="tab"><h2 class="tab-label">{html.escape(node.label)}</h2>{self.children(node)}</section>'
+        if kind == "flex_container" and children and all(c.type == "column" for c in children.values()):
+            return '<div class="row">' + "".join(f"<div>{self.children(c)}</div>" for c in self.ordered(node)) + "</div>"
+        if isinstance(children, dict):
+            return self.children(node)
+        if kind in ("title", "header", "subheader"):
+            tag = {"title": "h1", "header": "h2", "subheader": "h3"}[kind]
+            return f"<{tag}>{html.escape(node.proto.body)}</{tag}>" + ("<hr>" if node.proto.divider else "")
+        if kind == "markdown":
+            return _markdown(node.value)
+        if kind == "caption":
+            return f'<div class="caption">{_markdown(node.value)}</div>'
+        if kind == "divider":
+            return "<hr>"
+        if kind in ALERTS:
+            return f'<div class="alert {kind}">{_markdown(node.proto.body)}</div>'
+        if kind == "plotly_chart":
+            return _script("figure", node.proto.spec, "application/json")
+        if kind == "iframe":
+            return f'<iframe height="480" srcdoc="{html.escape(node.proto.srcdoc)}"></iframe>'
+        if kind == "metric":
+            return f'<div class="metric">{html.escape(node.label)}<b>{html.escape(str(node.value))}</b></div>'
+        if kind == "arrow_data_frame":
+            return node.value.to_html(border=0, float_format=lambda v: f"{v:,.3f}")
+        if kind in WIDGETS:
+            if kind == "button" or self.widgets_seen:
+                return ""
+            # One pointer per group of controls is enough
+            self.widgets_seen = True
+            if not self.live_url:
+                return '<p class="widget">🎛️ Interactive controls are available in the live app.</p>'
+            return f'<p class="widget">🎛️ Interactive controls. <a href="{self.live_url}">Try them in the live app →</a></p>'
+        return ""
+
+    def ordered(self, node):
+        return [node.children[k] for k in sorted(node.children)]
+
+    def children(self, node):
+        self.widgets_seen = False
+        return "".join(self.render(child) for child in self.ordered(node))
+
+
+def render_chapter(path, live_url, timeout=120):
+    """Runs one chapter headlessly and returns its body HTML."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.abspath(path), default_timeout=timeout).run()
+    if at.exception:
+        raise RuntimeError(f"{path}: {at.exception[0].message}")
+    return _Renderer(live_url).render(at.main)
+
+
+def slug(name):
+    return re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").lower()
+
+
+def export_site(out_dir="site", app_url="", root="."):
+    """
+    Pre-renders every chapter under `root` into `out_dir` and returns the written
+    paths. Links into the live app are only added when `app_url` is given.
+    """
+    chapters = list(manifest(root))
+    written = []
+    index = ["<h1>Financial Analysis Learning Platform</h1>"]
+    if app_url:
+        index.append(f'<p><a href="{app_url}">Open the interactive app →</a></p>')
+
+    for i, (folder, name, path) in enumerate(chapters):
+        if i == 0 or chapters[i - 1][0] != folder:
+            index.append(f"<h2>{html.escape(folder)}</h2><ul>")
+        live = page_url(folder, name, app_url) if app_url else None
+        body = render_chapter(path, live)
+
+        nav = ['<a href="../index.html">← All chapters</a>']
+        if live:
+            nav.append(f'<a href="{live}">Open in the live app</a>')
+        if i + 1 < len(chapters) and chapters[i + 1][0] == folder:
+            nav.append(f'<a href="{slug(chapters[i + 1][1])}.html">Next Chapter →</a>')
+        page = PAGE.format(title=html.escape(name), plotly=PLOTLY_JS, marked=MARKED_JS,
+                           body=f"<nav>{' '.join(nav)}</nav>{body}")
+
+        target = os.path.join(out_dir, folder, slug(name) + ".html")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(page)
+        written.append(target)
+        index.append(f'<li><a href="{folder}/{slug(name)}.html">{html.escape(name)}</a></li>')
+        if i + 1 == len(chapters) or chapters[i + 1][0] != folder:
+            index.append("</ul>")
+
+    target = os.path.join(out_dir, "index.html")
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(PAGE.format(title="Chapters", plotly=PLOTLY_JS, marked=MARKED_JS, body="".join(index)))
+    written.append(target)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m core.export", description="Pre-render every chapter to static HTML.")
+    parser.add_argument("--out", default="site", help="output folder (default: site)")
+    parser.add_argument("--app-url", default="", help="base URL of the live app; without it the pages have no live-app links")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+    for path in export_site(args.out, args.app_url):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
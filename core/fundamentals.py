@@ -0,0 +1,272 @@
+"""
+Fundamentals data layer and ratio engine.
+
+Statements are read from local files under ``data/fundamentals``, one table per
+statement (``income_statement*``, ``balance_sheet*``, ``cash_flow*`` and an
+optional ``prices*``) in CSV or Parquet, each with ``company`` and ``period``
+columns plus line items. They are joined into a `FundamentalsStore`: one numpy
+column per line item, rows sorted by (company, period).
+
+`compute_ratios` works on whole columns, so thousands of companies cost a
+handful of array operations. `load_store` and the ratios are cached and are
+rebuilt only when a source file changes (size or modification time).
+"""
+import glob
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join("data", "fundamentals")
+
+STATEMENTS = {
+    "income_statement": ["revenue", "cost_of_revenue", "operating_income", "net_income", "shares_outstanding"],
+    "balance_sheet": ["total_assets", "total_liabilities", "total_equity", "current_assets",
+                      "current_liabilities", "total_debt", "cash"],
+    "cash_flow": ["operating_cash_flow", "capital_expenditure"],
+    "prices": ["price"],
+}
+
+KEYS = ["company", "period"]
+LINE_ITEMS = {item for items in STATEMENTS.values() for item in items}
+
+
+class FundamentalsStore:
+    """Columnar table of statement line items keyed by (company, period)."""
+
+    def __init__(self, frame):
+        frame = frame.sort_values(KEYS, kind="stable").reset_index(drop=True)
+        self.companies = frame["company"].to_numpy()
+        self.periods = frame["period"].to_numpy()
+        self.columns = {}
+        for col in frame.columns:
+            if col in KEYS:
+                continue
+            if col in LINE_ITEMS:
+                # A stray "n/a" in a known line item becomes NaN instead of failing the load
+                self.columns[col] = pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype=float)
+            elif pd.api.types.is_numeric_dtype(frame[col]):
+                self.columns[col] = frame[col].to_numpy(dtype=float)
+            # Other text columns (currency, fiscal_date_ending, ...) are not line items
+        self._rows = None
+        self._ratios = None
+        self._screener = None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.companies)
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def column(self, name):
+        """Returns a line item column, or NaNs if no source file provided it."""
+        if name in self.columns:
+            return self.columns[name]
+        return np.full(len(self), np.nan)
+
+    def row(self, company, period):
+        """Returns the row number for (company, period)."""
+        if self._rows is None:
+            self._rows = {key: i for i, key in enumerate(zip(self.companies, self.periods))}
+        return self._rows[(company, period)]
+
+    def previous_row(self):
+        """Row of the prior period of the same company for each row, or -1."""
+        prev = np.arange(len(self)) - 1
+        same = np.zeros(len(self), dtype=bool)
+        same[1:] = self.companies[1:] == self.companies[:-1]
+        return np.where(same, prev, -1)
+
+    def latest(self):
+        """Boolean mask of each company's most recent period."""
+        last = np.ones(len(self), dtype=bool)
+        last[:-1] = self.companies[:-1] != self.companies[1:]
+        return last
+
+    def ratios(self):
+        """The ratio table for this store, computed once."""
+        with self._lock:
+            if self._ratios is None:
+                self._ratios = compute_ratios(self)
+            return self._ratios
+
+    def screener(self):
+        """The screener over each company's latest ratios, built once and dropped with the store."""
+        from core.screener import Screener
+
+        with self._lock:
+            if self._screener is None:
+                self._screener = Screener.from_store(self)
+            return self._screener
+
+    def to_frame(self):
+        frame = pd.DataFrame(self.columns)
+        frame.insert(0, "period", self.periods)
+        frame.insert(0, "company", self.companies)
+        return frame
+
+
+def _read_table(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _statement_files(directory):
+    files = {}
+    for statement in STATEMENTS:
+        pattern = os.path.join(directory, statement + "*")
+        files[statement] = sorted(f for f in glob.glob(pattern) if f.endswith((".csv", ".parquet")))
+    return files
+
+
+def _signature(files):
+    sig = []
+    for paths in files.values():
+        for path in paths:
+            stat = os.stat(path)
+            sig.append((path, stat.st_size, stat.st_mtime_ns))
+    return tuple(sig)
+
+
+def read_statements(directory=DATA_DIR):
+    """Bulk loads and joins every statement file under `directory`."""
+    merged = None
+    for statement, paths in _statement_files(directory).items():
+        if not paths:
+            continue
+        table = pd.concat([_read_table(p) for p in paths], ignore_index=True)
+        table = table.drop_duplicates(KEYS, keep="last")
+        merged = table if merged is None else merged.merge(table, on=KEYS, how="outer")
+    if merged is None:
+        raise FileNotFoundError(f"No statement files found in '{directory}'")
+    return FundamentalsStore(merged)
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def load_store(directory=DATA_DIR):
+    """Returns the cached store for `directory`, reloading it if any file changed."""
+    signature = _signature(_statement_files(directory))
+    with _cache_lock:
+        cached = _cache.get(directory)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    store = read_statements(directory)
+    with _cache_lock:
+        _cache[directory] = (signature, store)
+    return store
+
+
+def _safe_div(num, den):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = num / den
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+def _growth(values, prev):
+    prior = np.where(prev >= 0, values[prev], np.nan)
+    return _safe_div(values - prior, np.abs(prior))
+
+
+def compute_ratios(store):
+    """Returns a DataFrame of valuation, return, leverage, margin and growth ratios."""
+    c = store.column
+    revenue = c("revenue")
+    net_income = c("net_income")
+    # Ratios over book equity are meaningless once it is zero or negative, like P/E on losses
+    equity = np.where(c("total_equity") > 0, c("total_equity"), np.nan)
+    eps = _safe_div(net_income, c("shares_outstanding"))
+    fcf = c("operating_cash_flow") - np.abs(c("capital_expenditure"))
+    prev = store.previous_row()
+
+    ratios = {
+        "eps": eps,
+        "pe": np.where(eps > 0, _safe_div(c("price"), eps), np.nan),
+        "pb": _safe_div(c("price") * c("shares_outstanding"), equity),
+        "roe": _safe_div(net_income, equity),
+        "roa": _safe_div(net_income, c("total_assets")),
+        "debt_to_equity": _safe_div(c("total_debt"), equity),
+        "current_ratio": _safe_div(c("current_assets"), c("current_liabilities")),
+        "gross_margin": _safe_div(revenue - c("cost_of_revenue"), revenue),
+        "operating_margin": _safe_div(c("operating_income"), revenue),
+        "net_margin": _safe_div(net_income, revenue),
+        "fcf_margin": _safe_div(fcf, revenue),
+        "revenue_growth": _growth(revenue, prev),
+        "earnings_growth": _growth(net_income, prev),
+    }
+    frame = pd.DataFrame(ratios)
+    frame.insert(0, "period", store.periods)
+    frame.insert(0, "company", store.companies)
+    return frame
+
+
+def sample_statements(n_companies=500, n_periods=5, seed=42):
+    """Synthetic statements for demos: {statement: DataFrame}, like the chart chapters' dummy data."""
+    rng = np.random.default_rng(seed)
+    companies = np.repeat([f"CO{i:05d}" for i in range(n_companies)], n_periods)
+    periods = np.tile(np.arange(2020, 2020 + n_periods), n_companies)
+    size = np.repeat(rng.lognormal(6, 1.5, n_companies), n_periods)
+    growth = np.repeat(rng.normal(0.06, 0.08, n_companies), n_periods)
+    year = np.tile(np.arange(n_periods), n_companies)
+    revenue = size * (1 + growth) ** year * rng.lognormal(0, 0.05, len(year))
+
+    gross = np.clip(np.repeat(rng.normal(0.4, 0.15, n_companies), n_periods), 0.05, 0.9)
+    op_margin = gross * np.clip(rng.normal(0.45, 0.2, len(year)), -0.5, 0.9)
+    net_income = revenue * op_margin * 0.75
+    assets = revenue * np.repeat(rng.uniform(0.6, 2.5, n_companies), n_periods)
+    leverage = np.repeat(rng.uniform(0.1, 0.8, n_companies), n_periods)
+    liabilities = assets * leverage
+    shares = np.repeat(rng.uniform(50, 2000, n_companies), n_periods)
+    multiple = np.repeat(rng.lognormal(np.log(18), 0.5, n_companies), n_periods)
+
+    base = {"company": companies, "period": periods}
+    return {
+        "income_statement": pd.DataFrame({
+            **base,
+            "revenue": revenue,
+            "cost_of_revenue": revenue * (1 - gross),
+            "operating_income": revenue * op_margin,
+            "net_income": net_income,
+            "shares_outstanding": shares,
+        }),
+        "balance_sheet": pd.DataFrame({
+            **base,
+            "total_assets": assets,
+            "total_liabilities": liabilities,
+            "total_equity": assets - liabilities,
+            "current_assets": assets * 0.4,
+            "current_liabilities": liabilities * rng.uniform(0.2, 0.6, len(year)),
+            "total_debt": liabilities * 0.6,
+            "cash": assets * 0.1,
+        }),
+        "cash_flow": pd.DataFrame({
+            **base,
+            "operating_cash_flow": net_income * rng.uniform(0.9, 1.4, len(year)),
+            "capital_expenditure": revenue * rng.uniform(0.02, 0.1, len(year)),
+        }),
+        "prices": pd.DataFrame({
+            **base,
+            "price": np.abs(net_income) / shares * multiple,
+        }),
+    }
+
+
+def write_sample_files(directory=DATA_DIR, **kwargs):
+    """Writes `sample_statements` as CSV files the loader understands."""
+    os.makedirs(directory, exist_ok=True)
+    for statement, frame in sample_statements(**kwargs).items():
+        frame.to_csv(os.path.join(directory, f"{statement}.csv"), index=False)
+
+
+def sample_store(**kwargs):
+    """A store built straight from `sample_statements`, without touching disk."""
+    merged = None
+    for frame in sample_statements(**kwargs).values():
+        merged = frame if merged is None else merged.merge(frame, on=KEYS, how="outer")
+    return FundamentalsStore(merged)
@@ -0,0 +1,345 @@
+"""
+Technical indicators computed over a (symbols x time) price matrix.
+
+Every batch function accepts a 1-D series or a 2-D array whose rows are
+symbols and whose columns are bars, and works along the time axis for all
+symbols at once. Recursive indicators (EMA, RSI, ATR) are written as a
+single pass over the time axis that is vectorized across symbols. Outputs
+can be written into caller supplied buffers through ``out=``; indicators
+with several lines (MACD, Bollinger) take a tuple of buffers.
+
+The ``*State`` classes hold the running state of an indicator so it can
+advance by one bar in O(1), which is what the replay mode and detectors use.
+"""
+import numpy as np
+
+
+def _as_2d(values):
+    """Returns a float 2-D view of `values` and whether the input was 1-D."""
+    arr = np.asarray(values, dtype=float)
+    if arr.ndim == 1:
+        return arr[np.newaxis, :], True
+    if arr.ndim != 2:
+        raise ValueError("expected a 1-D series or a 2-D (symbols x time) array")
+    return arr, False
+
+
+def _output(shape, out):
+    """Returns `out` reshaped to 2-D, or a new NaN-filled buffer of `shape`."""
+    if out is None:
+        return np.full(shape, np.nan)
+    buf = out[np.newaxis, :] if out.ndim == 1 else out
+    if buf.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+    buf.fill(np.nan)
+    return buf
+
+
+def _outputs(shape, out, count):
+    """Like `_output` for indicators that return `count` series."""
+    if out is None:
+        return [_output(shape, None) for _ in range(count)]
+    if len(out) != count:
+        raise ValueError(f"out must be a tuple of {count} buffers")
+    return [_output(shape, o) for o in out]
+
+
+def _check_period(name, value):
+    if value < 1:
+        raise ValueError(f"{name} must be >= 1")
+
+
+def _result(buf, squeeze):
+    return buf[0] if squeeze else buf
+
+
+def sma(values, window, out=None):
+    """Simple moving average using a running cumulative sum."""
+    _check_period("window", window)
+    x, squeeze = _as_2d(values)
+    buf = _output(x.shape, out)
+    n = x.shape[1]
+    if n >= window:
+        csum = np.cumsum(x, axis=1)
+        buf[:, window - 1] = csum[:, window - 1]
+        buf[:, window:] = csum[:, window:] - csum[:, :-window]
+        buf[:, window - 1:] /= window
+    return _result(buf, squeeze)
+
+
+def _recursive_filter(x, alpha, start, seed, buf):
+    """Runs y[t] = alpha * x[t] + (1 - alpha) * y[t-1] from bar `start` on."""
+    buf[:, start] = seed
+    prev = buf[:, start]
+    decay = 1.0 - alpha
+    for t in range(start + 1, x.shape[1]):
+        prev = alpha * x[:, t] + decay * prev
+        buf[:, t] = prev
+    return buf
+
+
+def ema(values, span, out=None):
+    """Exponential moving average seeded with the SMA of the first `span` bars."""
+    _check_period("span", span)
+    x, squeeze = _as_2d(values)
+    buf = _output(x.shape, out)
+    if x.shape[1] >= span:
+        seed = x[:, :span].mean(axis=1)
+        _recursive_filter(x, 2.0 / (span + 1), span - 1, seed, buf)
+    return _result(buf, squeeze)
+
+
+def _wilder(x, period, start, buf):
+    """Wilder smoothing (alpha = 1 / period) seeded with a simple average."""
+    _check_period("period", period)
+    if x.shape[1] - start >= period:
+        seed = x[:, start:start + period].mean(axis=1)
+        _recursive_filter(x, 1.0 / period, start + period - 1, seed, buf)
+    return buf
+
+
+def rsi(values, period=14, out=None):
+    """Relative Strength Index with Wilder smoothing."""
+    x, squeeze = _as_2d(values)
+    buf = _output(x.shape, out)
+    change = np.diff(x, axis=1, prepend=x[:, :1])
+    gain = _wilder(np.clip(change, 0, None), period, 1, np.full(x.shape, np.nan))
+    loss = _wilder(np.clip(-change, 0, None), period, 1, np.full(x.shape, np.nan))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.subtract(100.0, 100.0 / (1.0 + gain / loss), out=buf)
+    buf[(loss == 0) & ~np.isnan(gain)] = 100.0
+    return _result(buf, squeeze)
+
+
+def macd(values, fast=12, slow=26, signal=9, out=None):
+    """Returns (macd line, signal line, histogram)."""
+    _check_period("signal", signal)
+    x, squeeze = _as_2d(values)
+    line, sig, hist = _outputs(x.shape, out, 3)
+    ema(x, fast, out=line)
+    line -= ema(x, slow)
+    valid = slow - 1
+    if x.shape[1] - valid >= signal:
+        ema(line[:, valid:], signal, out=sig[:, valid:])
+    np.subtract(line, sig, out=hist)
+    return _result(line, squeeze), _result(sig, squeeze), _result(hist, squeeze)
+
+
+def true_range(high, low, close):
+    """True range; the first bar falls back to high - low."""
+    h, squeeze = _as_2d(high)
+    lo, _ = _as_2d(low)
+    c, _ = _as_2d(close)
+    prev_close = np.concatenate([c[:, :1], c[:, :-1]], axis=1)
+    tr = np.maximum(h, prev_close) - np.minimum(lo, prev_close)
+    return _result(tr, squeeze)
+
+
+def atr(high, low, close, period=14, out=None):
+    """Average True Range with Wilder smoothing."""
+    tr, squeeze = _as_2d(true_range(high, low, close))
+    buf = _output(tr.shape, out)
+    _wilder(tr, period, 0, buf)
+    return _result(buf, squeeze)
+
+
+def bollinger(values, window=20, num_std=2.0, out=None):
+    """Returns (middle, upper, lower) bands around the SMA."""
+    x, squeeze = _as_2d(values)
+    mid, upper, lower = _outputs(x.shape, out, 3)
+    sma(x, window, out=mid)
+    std = sma(x * x, window)
+    std -= mid * mid
+    np.sqrt(np.clip(std, 0, None, out=std), out=std)
+    std *= num_std
+    np.add(mid, std, out=upper)
+    np.subtract(mid, std, out=lower)
+    return _result(mid, squeeze), _result(upper, squeeze), _result(lower, squeeze)
+
+
+class SMAState:
+    """Running simple moving average over a ring buffer."""
+
+    def __init__(self, window, n_symbols=1):
+        _check_period("window", window)
+        self.window = window
+        self._ring = np.zeros((window, n_symbols))
+        self._sum = np.zeros(n_symbols)
+        self._count = 0
+
+    def update(self, value):
+        value = np.asarray(value, dtype=float)
+        slot = self._count % self.window
+        self._sum += value - self._ring[slot]
+        self._ring[slot] = value
+        self._count += 1
+        if self._count < self.window:
+            return np.full_like(self._sum, np.nan)
+        return self._sum / self.window
+
+
+class EMAState:
+    """Running EMA; emits NaN until `span` bars have been seen, like `ema`."""
+
+    def __init__(self, span, n_symbols=1, alpha=None):
+        _check_period("span", span)
+        self.span = span
+        self.alpha = 2.0 / (span + 1) if alpha is None else alpha
+        self._seed = SMAState(span, n_symbols)
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            seed = self._seed.update(value)
+            if not np.isnan(seed).all():
+                self.value = seed
+            return seed
+        self.value = self.alpha * np.asarray(value, dtype=float) + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class RSIState:
+    """Running RSI matching `rsi` bar for bar."""
+
+    def __init__(self, period=14, n_symbols=1):
+        self._gain = EMAState(period, n_symbols, alpha=1.0 / period)
+        self._loss = EMAState(period, n_symbols, alpha=1.0 / period)
+        self._prev = None
+
+    def update(self, value):
+        value = np.asarray(value, dtype=float)
+        if self._prev is None:
+            self._prev = value
+            return np.full(value.shape, np.nan)
+        change = value - self._prev
+        self._prev = value
+        gain = self._gain.update(np.clip(change, 0, None))
+        loss = self._loss.update(np.clip(-change, 0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = 100.0 - 100.0 / (1.0 + gain / loss)
+        return np.where((loss == 0) & ~np.isnan(gain), 100.0, out)
+
+
+class MACDState:
+    """Running MACD; `update` returns (macd line, signal line, histogram)."""
+
+    def __init__(self, fast=12, slow=26, signal=9, n_symbols=1):
+        self._fast = EMAState(fast, n_symbols)
+        self._slow = EMAState(slow, n_symbols)
+        self._signal = EMAState(signal, n_symbols)
+
+    def update(self, value):
+        line = self._fast.update(value) - self._slow.update(value)
+        if np.isnan(line).all():
+            sig = line
+        else:
+            sig = self._signal.update(line)
+        return line, sig, line - sig
+
+
+class ATRState:
+    """Running ATR from high, low and close bars."""
+
+    def __init__(self, period=14, n_symbols=1):
+        self._avg = EMAState(period, n_symbols, alpha=1.0 / period)
+        self._prev_close = None
+
+    def update(self, high, low, close):
+        high = np.asarray(high, dtype=float)
+        low = np.asarray(low, dtype=float)
+        prev = close if self._prev_close is None else self._prev_close
+        tr = np.maximum(high, prev) - np.minimum(low, prev)
+        self._prev_close = np.asarray(close, dtype=float)
+        return self._avg.update(tr)
+
+
+class BollingerState:
+    """Running Bollinger bands; `update` returns (middle, upper, lower)."""
+
+    def __init__(self, window=20, num_std=2.0, n_symbols=1):
+        self.num_std = num_std
+        self._mean = SMAState(window, n_symbols)
+        self._mean_sq = SMAState(window, n_symbols)
+
+    def update(self, value):
+        value = np.asarray(value, dtype=float)
+        mid = self._mean.update(value)
+        std = np.sqrt(np.clip(self._mean_sq.update(value * value) - mid * mid, 0, None))
+        return mid, mid + self.num_std * std, mid - self.num_std * std
+
+
+# Name -> (batch function, price inputs it needs)
+INDICATORS = {
+    "SMA": (sma, ("close",)),
+    "EMA": (ema, ("close",)),
+    "RSI": (rsi, ("close",)),
+    "MACD": (macd, ("close",)),
+    "ATR": (atr, ("high", "low", "close")),
+    "Bollinger": (bollinger, ("close",)),
+}
+
+
+class IndicatorSet:
+    """
+    Computes indicators for every symbol of a price matrix and keeps the results,
+    so overlaying the same indicator on another symbol does not recompute it.
+    """
+
+    def __init__(self, close, high=None, low=None, symbols=None):
+        self.prices = {"close": _as_2d(close)[0]}
+        if high is not None:
+            self.prices["high"] = _as_2d(high)[0]
+        if low is not None:
+            self.prices["low"] = _as_2d(low)[0]
+        n_symbols = self.prices["close"].shape[0]
+        self.symbols = list(symbols) if symbols is not None else list(range(n_symbols))
+        self._cache = {}
+
+    def compute(self, name, **params):
+        """Returns the full (symbols x time) result, computing it at most once."""
+        key = (name, tuple(sorted(params.items())))
+        if key not in self._cache:
+            func, inputs = INDICATORS[name]
+            missing = [i for i in inputs if i not in self.prices]
+            if missing:
+                raise ValueError(f"{name} needs {', '.join(missing)} prices")
+            self._cache[key] = func(*(self.prices[i] for i in inputs), **params)
+        return self._cache[key]
+
+    def get(self, name, symbol=0, **params):
+        """Returns the indicator for one symbol (a row, or a tuple of rows)."""
+        row = self.symbols.index(symbol)
+        result = self.compute(name, **params)
+        if isinstance(result, tuple):
+            return tuple(r[row] for r in result)
+        return result[row]
+
+
+# Indicators that are not in price units and belong on their own axis
+OSCILLATORS = {"RSI", "MACD", "ATR"}
+
+
+def _is_oscillator(name):
+    """True for overlay names such as "RSI", "RSI 14" or "MACD(12, 26)"."""
+    return name.replace("(", " ").split()[0] in OSCILLATORS
+
+
+def add_overlays(fig, x, overlays, **trace_kwargs):
+    """
+    Adds one line trace per {name: series or tuple of series} to a Plotly figure.
+    Price-unit indicators share the price axis; oscillators go on a secondary
+    y-axis on the right so they stay readable.
+    """
+    import plotly.graph_objects as go
+
+    secondary = False
+    for name, series in overlays.items():
+        parts = series if isinstance(series, tuple) else (series,)
+        axis = "y2" if _is_oscillator(name) else "y"
+        secondary = secondary or axis == "y2"
+        for i, y in enumerate(parts):
+            label = name if len(parts) == 1 else f"{name} ({i + 1})"
+            fig.add_trace(go.Scatter(x=x, y=y, mode="lines", name=label, yaxis=axis, **trace_kwargs))
+    if secondary:
+        fig.update_layout(yaxis2=dict(overlaying="y", side="right", showgrid=False, title="Indicator"))
+    return fig
@@ -0,0 +1,113 @@
+"""
+Speculative prefetch of the next chapter.
+
+While a learner reads one chapter, the runner passes the next chapter's path
+and the module name it loads chapters under to `schedule`. A background
+worker compiles the script and runs it once outside any session under that
+same name (Streamlit keys its caches on the function's module), so its imports, ``st.cache_data`` / ``st.cache_resource``
+entries and the Plotly validators for its default figures are warm when
+"Next Chapter →" is clicked. Widgets return their defaults there, and the
+worker has no ScriptRunContext, so nothing reaches a browser.
+
+Prefetch is bounded: one worker per process, one pending chapter (the latest
+request wins), each file version runs once, and the worker spends at most
+``APP_PREFETCH_BUDGET`` CPU seconds per minute (default 10, 0 turns it off).
+"""
+import logging
+import os
+import threading
+import time
+
+BUDGET_S = float(os.environ.get("APP_PREFETCH_BUDGET", "10"))
+WINDOW_S = 60.0
+THREAD_NAME = "chapter-prefetch"
+
+_lock = threading.Lock()
+_code = {}
+_done = set()
+_spent = []
+_pending = None
+_worker = None
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def compiled(path):
+    """Code object for a chapter script, compiled once per file version."""
+    sig = _signature(path)
+    entry = _code.get(path)
+    if entry is None or entry[0] != sig:
+        with open(path, encoding="utf-8") as f:
+            entry = (sig, compile(f.read(), path, "exec"))
+        _code[path] = entry
+    return entry[1]
+
+
+class _QuietWorker(logging.Filter):
+    """Drops Streamlit's missing-context warnings raised by the prefetch thread."""
+
+    def filter(self, record):
+        return record.threadName != THREAD_NAME
+
+
+logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(_QuietWorker())
+
+
+def _recent_spend(now):
+    _spent[:] = [(t, s) for t, s in _spent if now - t < WINDOW_S]
+    return sum(s for _, s in _spent)
+
+
+def _run(path, module_name):
+    start = time.thread_time()
+    try:
+        exec(compiled(path), {"__name__": module_name, "__file__": path})
+    except Exception as e:
+        logging.getLogger(__name__).info("prefetch of %s failed: %s", path, e)
+    return time.thread_time() - start
+
+
+def _loop():
+    global _pending, _worker
+    while True:
+        with _lock:
+            key = _pending
+            _pending = None
+            if key is not None and _recent_spend(time.monotonic()) >= BUDGET_S:
+                # Over budget: forget it so a later visit can try again
+                _done.discard(key)
+                key = None
+            if key is None:
+                _worker = None
+                return
+        spent = _run(*key[:2])
+        with _lock:
+            _spent.append((time.monotonic(), spent))
+
+
+def schedule(path, module_name):
+    """
+    Queues `path` for prefetch as module `module_name`, which must be the name
+    the runner executes it under. Returns False if it is already warm or over budget.
+    """
+    global _pending, _worker
+    if BUDGET_S <= 0:
+        return False
+    try:
+        key = (path, module_name, _signature(path))
+    except OSError:
+        return False
+    with _lock:
+        if key in _done or _recent_spend(time.monotonic()) >= BUDGET_S:
+            return False
+        if _pending is not None:
+            _done.discard(_pending)
+        _done.add(key)
+        _pending = key
+        if _worker is None:
+            _worker = threading.Thread(target=_loop, name=THREAD_NAME, daemon=True)
+            _worker.start()
+    return True
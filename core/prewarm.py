@@ -0,0 +1,46 @@
+"""
+Optional background pre-warm of the plotting stack.
+
+numpy, pandas and Plotly take most of a cold start, and Plotly also loads its
+trace validators the first time a figure is built. With ``APP_PREWARM`` set,
+`start` does all of that once per server process on a daemon thread, so the
+first visit to a chart chapter does not pay for it. Text-only pages import
+only streamlit and this module, which uses the standard library alone.
+"""
+import importlib
+import os
+import threading
+import time
+
+ENABLED = bool(os.environ.get("APP_PREWARM"))
+MODULES = ["numpy", "pandas", "plotly.graph_objects", "plotly.subplots", "plotly.io"]
+
+_started = False
+_lock = threading.Lock()
+elapsed = None
+
+
+def _warm():
+    global elapsed
+    start = time.perf_counter()
+    for name in MODULES:
+        importlib.import_module(name)
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    # Building and serializing one figure of each trace type loads their validators
+    fig = go.Figure([go.Scatter(y=[1, 2]), go.Candlestick(open=[1], high=[2], low=[0], close=[1]), go.Bar(y=[1])])
+    pio.to_json(fig)
+    elapsed = time.perf_counter() - start
+
+
+def start(force=False):
+    """Starts the pre-warm thread once per process; no-op unless enabled."""
+    global _started
+    if not (ENABLED or force):
+        return
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_warm, name="prewarm", daemon=True).start()
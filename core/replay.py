@@ -0,0 +1,171 @@
+"""
+Bar replay: streams historical or synthetic bars into a chart at a chosen speed.
+
+One `ReplayHub` per server process runs a single asyncio event loop on a
+background thread. Every replaying session is a producer task on that loop
+that pushes bars into its `ReplaySession`. The session advances its
+indicators with the O(1) state objects from `core.indicators` and records
+the new row. The Streamlit side fetches only the rows it has not drawn yet
+and appends them to the chart with `add_rows`, so the chapter script is not
+rerun and the full figure is never re-sent.
+
+Sessions are bounded: a producer stops after `limit` bars or once nobody has
+polled `rows_since` for `idle_timeout` seconds (the tab was closed or the
+learner moved on), idle sessions are dropped from the hub, and at most
+`max_sessions` replays run at once.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from core.indicators import BollingerState, EMAState, RSIState, SMAState
+
+# Name -> factory for a single-symbol incremental indicator on the close
+REPLAY_INDICATORS = {
+    "SMA 20": lambda: SMAState(20),
+    "EMA 20": lambda: EMAState(20),
+    "RSI 14": lambda: RSIState(14),
+    "Bollinger 20": lambda: BollingerState(20),
+}
+
+
+def synthetic_bars(start=100.0, volatility=1.5, seed=None):
+    """Endless random-walk OHLC bars as dicts, like Chapter 5's dummy data."""
+    rng = np.random.default_rng(seed)
+    price = start
+    while True:
+        change = rng.normal(0, volatility)
+        open_p, close_p = price, price + change
+        yield {
+            "Open": open_p,
+            "High": max(open_p, close_p) + abs(rng.normal(0, 0.5)),
+            "Low": min(open_p, close_p) - abs(rng.normal(0, 0.5)),
+            "Close": close_p,
+        }
+        price = close_p
+
+
+def frame_bars(df):
+    """Yields the rows of an OHLC DataFrame as dicts."""
+    for row in df[["Open", "High", "Low", "Close"]].itertuples(index=False):
+        yield row._asdict()
+
+
+class ReplaySession:
+    """Per-learner replay state: indicator states plus the rows not yet drawn."""
+
+    def __init__(self, indicators=(), max_history=2000):
+        self.indicators = {name: REPLAY_INDICATORS[name]() for name in indicators}
+        self.bar_count = 0
+        self.done = False
+        self.last_polled = time.monotonic()
+        self._history = deque(maxlen=max_history)
+        self._lock = threading.Lock()
+
+    def idle_for(self):
+        """Seconds since the chart last asked for rows."""
+        return time.monotonic() - self.last_polled
+
+    def columns(self):
+        cols = ["Close"]
+        for name in self.indicators:
+            if name.startswith("Bollinger"):
+                cols += [f"{name} upper", f"{name} lower"]
+            else:
+                cols.append(name)
+        return cols
+
+    def advance(self, bar):
+        """Advances every indicator by one bar and records the new chart row."""
+        row = {"Close": bar["Close"]}
+        for name, state in self.indicators.items():
+            value = state.update(bar["Close"])
+            if isinstance(value, tuple):
+                _, upper, lower = value
+                row[f"{name} upper"] = float(np.ravel(upper)[0])
+                row[f"{name} lower"] = float(np.ravel(lower)[0])
+            else:
+                row[name] = float(np.ravel(value)[0])
+        with self._lock:
+            self._history.append((self.bar_count, row))
+            self.bar_count += 1
+        return row
+
+    def rows_since(self, last_index=-1):
+        """Returns (bar indexes, rows) recorded after bar `last_index`."""
+        self.last_polled = time.monotonic()
+        with self._lock:
+            new = []
+            for item in reversed(self._history):
+                if item[0] <= last_index:
+                    break
+                new.append(item)
+        new.reverse()
+        return [i for i, _ in new], [r for _, r in new]
+
+
+class ReplayHub:
+    """Runs the producers of every replaying session on one shared event loop."""
+
+    def __init__(self, max_sessions=50, idle_timeout=15.0):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._loop = asyncio.new_event_loop()
+        self._tasks = {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+        threading.Thread(target=self._loop.run_forever, name="replay-hub", daemon=True).start()
+
+    async def _produce(self, key, session, bars, bars_per_second, limit):
+        delay = 1.0 / bars_per_second
+        try:
+            for n, bar in enumerate(bars):
+                if (limit is not None and n >= limit) or session.idle_for() > self.idle_timeout:
+                    break
+                session.advance(bar)
+                await asyncio.sleep(delay)
+        finally:
+            session.done = True
+        # Keep the finished rows for the chart to drain, then forget the session
+        while session.idle_for() <= self.idle_timeout:
+            await asyncio.sleep(min(1.0, self.idle_timeout))
+        self._forget(key, session)
+
+    def _forget(self, key, session):
+        with self._lock:
+            if self._sessions.get(key) is session:
+                del self._sessions[key]
+                self._tasks.pop(key, None)
+
+    def start(self, key, bars, bars_per_second=5.0, indicators=(), limit=None):
+        """
+        Starts (or restarts) the replay for `key` and returns its session, or None
+        when `max_sessions` other replays are already running.
+        """
+        self.stop(key)
+        with self._lock:
+            if self.active_count() >= self.max_sessions:
+                return None
+            session = ReplaySession(indicators)
+            self._sessions[key] = session
+            coro = self._produce(key, session, bars, bars_per_second, limit)
+            self._tasks[key] = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return session
+
+    def stop(self, key):
+        with self._lock:
+            task = self._tasks.pop(key, None)
+            session = self._sessions.pop(key, None)
+        if task is not None:
+            task.cancel()
+        if session is not None:
+            session.done = True
+
+    def session(self, key):
+        return self._sessions.get(key)
+
+    def active_count(self):
+        return sum(not s.done for s in list(self._sessions.values()))
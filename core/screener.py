@@ -0,0 +1,128 @@
+"""
+Indexed stock screener over a columnar company table.
+
+For every metric the screener keeps the row order sorted by value and each
+row's rank in that order. A condition such as ``pe < 15`` is answered with a
+binary search, which gives a contiguous range of ranks. A multi-criteria
+query takes the narrowest range as candidates and keeps those whose rank
+falls inside every other range, so the work is proportional to the smallest
+match set and not to the size of the universe.
+"""
+import re
+
+import numpy as np
+
+OPERATORS = ("<=", ">=", "<", ">", "==")
+_CONDITION = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*(<=|>=|<|>|==)\s*(-?[0-9.]+)\s*(%?)\s*$")
+
+
+class MetricIndex:
+    """Sorted order and ranks of one metric; NaNs sort last and never match."""
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        self.order = np.argsort(values, kind="stable")
+        self.sorted = values[self.order]
+        self.rank = np.empty(len(values), dtype=np.int64)
+        self.rank[self.order] = np.arange(len(values))
+        self.valid = len(values) - int(np.isnan(values).sum())
+
+    def range(self, op, value):
+        """Returns the [start, stop) rank range satisfying `metric op value`."""
+        valid = self.sorted[:self.valid]
+        if op == "<":
+            return 0, int(np.searchsorted(valid, value, side="left"))
+        if op == "<=":
+            return 0, int(np.searchsorted(valid, value, side="right"))
+        if op == ">":
+            return int(np.searchsorted(valid, value, side="right")), self.valid
+        if op == ">=":
+            return int(np.searchsorted(valid, value, side="left")), self.valid
+        if op == "==":
+            return int(np.searchsorted(valid, value, side="left")), int(np.searchsorted(valid, value, side="right"))
+        raise ValueError(f"Unknown operator '{op}'")
+
+
+def parse_query(text):
+    """Parses 'pe < 15 and roe > 20% and debt_to_equity < 0.5' into (metric, op, value) tuples."""
+    conditions = []
+    for part in re.split(r"\s+and\s+|,", text.strip(), flags=re.IGNORECASE):
+        if not part.strip():
+            continue
+        match = _CONDITION.match(part)
+        if not match:
+            raise ValueError(f"Cannot parse condition '{part.strip()}'")
+        metric, op, number, percent = match.groups()
+        value = float(number) / 100 if percent else float(number)
+        conditions.append((metric, op, value))
+    return conditions
+
+
+class Screener:
+    """Screens the rows of {metric: values} with per-metric sorted indexes."""
+
+    def __init__(self, columns, labels=None):
+        self.columns = {name: np.asarray(values, dtype=float) for name, values in columns.items()}
+        self.labels = None if labels is None else np.asarray(labels)
+        self.indexes = {name: MetricIndex(values) for name, values in self.columns.items()}
+
+    @classmethod
+    def from_store(cls, store, metrics=None):
+        """One row per company (its latest period) with the ratio columns of a FundamentalsStore."""
+        ratios = store.ratios()
+        latest = store.latest()
+        metrics = metrics or [c for c in ratios.columns if c not in ("company", "period")]
+        columns = {m: ratios[m].to_numpy()[latest] for m in metrics}
+        return cls(columns, labels=store.companies[latest])
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def query(self, conditions, sort_by=None, descending=False, limit=None):
+        """
+        Returns the row numbers matching every (metric, op, value) condition, or the
+        rows of a query string. Sorted by `sort_by` when given, else by row number.
+        """
+        if isinstance(conditions, str):
+            conditions = parse_query(conditions)
+        ranges = []
+        for metric, op, value in conditions:
+            if metric not in self.indexes:
+                raise KeyError(f"Unknown metric '{metric}'")
+            start, stop = self.indexes[metric].range(op, value)
+            if start >= stop:
+                return np.empty(0, dtype=np.int64)
+            ranges.append((stop - start, metric, start, stop))
+
+        if not ranges:
+            rows = np.arange(len(self))
+        else:
+            ranges.sort()
+            _, metric, start, stop = ranges[0]
+            rows = self.indexes[metric].order[start:stop]
+            for _, metric, start, stop in ranges[1:]:
+                rank = self.indexes[metric].rank[rows]
+                rows = rows[(rank >= start) & (rank < stop)]
+                if not len(rows):
+                    break
+
+        if sort_by is not None:
+            index = self.indexes[sort_by]
+            key = index.rank[rows]
+            # Rows with no value for sort_by go last in either direction
+            has_value = key < index.valid
+            ranked = rows[has_value][np.argsort(-key[has_value] if descending else key[has_value], kind="stable")]
+            rows = np.concatenate([ranked, np.sort(rows[~has_value])])
+        else:
+            rows = np.sort(rows)
+        return rows[:limit] if limit is not None else rows
+
+    def frame(self, rows, metrics=None):
+        """A DataFrame of the given rows, for display."""
+        import pandas as pd
+
+        metrics = metrics or list(self.columns)
+        frame = pd.DataFrame({m: self.columns[m][rows] for m in metrics})
+        if self.labels is not None:
+            frame.insert(0, "company", self.labels[rows])
+        return frame
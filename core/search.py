@@ -0,0 +1,233 @@
+"""
+Full-text search over chapter content, built without running any chapter.
+
+The text is taken from the string literals passed to ``st.title``,
+``st.header``, ``st.subheader``, ``st.write``, ``st.markdown`` and the alert
+calls (directly or through a variable holding a literal), plus ``st.tabs``
+labels and radio/selectbox options, read from each chapter's AST. One
+document is kept per (chapter, section); a section starts at each heading.
+
+The inverted index maps a term to {document: occurrences}. `refresh` re-parses
+only chapter files whose size or modification time changed. A query is a
+couple of dictionary lookups and a set intersection; the last term also
+matches as a prefix so results appear while typing.
+"""
+import ast
+import bisect
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+from core.chapters import MODULES, manifest
+
+TEXT_CALLS = {"title", "header", "subheader", "write", "markdown", "caption",
+              "info", "success", "warning", "error"}
+HEADINGS = {"title", "header", "subheader"}
+CHOICES = {"radio", "selectbox"}
+TOKEN = re.compile(r"[a-z0-9]+")
+
+logger = logging.getLogger(__name__)
+
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+
+def _literal(node):
+    """The text of a str constant, else None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def extract_sections(path):
+    """Returns [(section heading, text)] for the st.* string literals in `path`."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    calls = []
+    # Strings bound to a name, for calls like st.success(msg)
+    assigned = defaultdict(list)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and _literal(node.value):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    assigned[target.id].append(node.value.value)
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name) and node.func.value.id == "st"):
+            calls.append(node)
+    # ast.walk is breadth-first; sections need source order
+    calls.sort(key=lambda n: (n.lineno, n.col_offset))
+
+    sections = [["", []]]
+    for call in calls:
+        name = call.func.attr
+        options = call.args[0] if name == "tabs" else call.args[1] if name in CHOICES and len(call.args) > 1 else None
+        if isinstance(options, ast.List):
+            sections[-1][1].extend(t for t in map(_literal, options.elts) if t)
+            continue
+        if name not in TEXT_CALLS:
+            continue
+        texts = []
+        for arg in call.args:
+            if isinstance(arg, ast.Name):
+                texts.extend(assigned.get(arg.id, ()))
+            elif _literal(arg):
+                texts.append(arg.value)
+        if not texts:
+            continue
+        if name in HEADINGS:
+            sections.append([texts[0], []])
+        sections[-1][1].extend(texts)
+    return [(heading, "\n".join(parts)) for heading, parts in sections if parts]
+
+
+class SearchIndex:
+    """Inverted index over the chapters, refreshed per file."""
+
+    def __init__(self, root="."):
+        self.root = root
+        self.docs = {}
+        self._postings = defaultdict(dict)
+        self._terms = []
+        self._files = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._checked = 0.0
+
+    def refresh(self, min_interval=0.0):
+        """
+        Re-indexes new or changed chapter files and drops deleted ones. A file that
+        does not parse (e.g. a half-saved edit) is logged and keeps its last indexed
+        version until it changes again.
+        """
+        if time.monotonic() - self._checked < min_interval:
+            return
+        with self._lock:
+            seen = set()
+            changed = False
+            for folder, chapter, path in manifest(self.root):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                signature = (stat.st_size, stat.st_mtime_ns)
+                entry = self._files.get(path)
+                if entry and entry[0] == signature:
+                    continue
+                old_ids = entry[1] if entry else []
+                try:
+                    sections = extract_sections(path)
+                except (SyntaxError, ValueError, OSError) as e:
+                    logger.warning("search: not indexing %s: %s", path, e)
+                    self._files[path] = (signature, old_ids)
+                    continue
+                self._remove(old_ids)
+                self._files[path] = (signature, self._add(folder, chapter, sections))
+                changed = True
+            for path in set(self._files) - seen:
+                self._remove(self._files.pop(path)[1])
+                changed = True
+            if changed:
+                self._terms = sorted(self._postings)
+            self._checked = time.monotonic()
+
+    def _add(self, folder, chapter, sections):
+        ids = []
+        for heading, text in sections:
+            doc_id = self._next_id
+            self._next_id += 1
+            self.docs[doc_id] = {"folder": folder, "chapter": chapter, "section": heading, "text": text}
+            for term, count in Counter(tokenize(text)).items():
+                self._postings[term][doc_id] = count
+            ids.append(doc_id)
+        return ids
+
+    def _remove(self, doc_ids):
+        for doc_id in doc_ids:
+            doc = self.docs.pop(doc_id, None)
+            if doc is None:
+                continue
+            for term in set(tokenize(doc["text"])):
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def _matching(self, term, prefix):
+        if not prefix:
+            return self._postings.get(term, {})
+        merged = {}
+        i = bisect.bisect_left(self._terms, term)
+        while i < len(self._terms) and self._terms[i].startswith(term):
+            for doc_id, count in self._postings.get(self._terms[i], {}).items():
+                merged[doc_id] = merged.get(doc_id, 0) + count
+            i += 1
+        return merged
+
+    def search(self, query, limit=10):
+        """Sections containing every query term, best first, as dicts with a snippet."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        # refresh() may be rewriting the postings from another session's script thread
+        with self._lock:
+            return self._search(terms, limit)
+
+    def _search(self, terms, limit):
+        scores = None
+        for i, term in enumerate(terms):
+            postings = self._matching(term, prefix=(i == len(terms) - 1))
+            if scores is None:
+                scores = dict(postings)
+            else:
+                scores = {d: s + postings[d] for d, s in scores.items() if d in postings}
+            if not scores:
+                return []
+        ranked = sorted(scores, key=lambda d: -scores[d])[:limit]
+        return [dict(self.docs[d], score=scores[d], snippet=snippet(self.docs[d]["text"], terms)) for d in ranked]
+
+
+def snippet(text, terms, width=120):
+    """A short excerpt of `text` around the first query term."""
+    lower = text.lower()
+    hits = [lower.find(t) for t in terms if lower.find(t) >= 0]
+    start = max(0, min(hits) - width // 3) if hits else 0
+    excerpt = " ".join(text[start:start + width].split())
+    return ("…" if start else "") + excerpt + ("…" if start + width < len(text) else "")
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """The process-wide index, built on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SearchIndex()
+    _index.refresh(min_interval=2.0)
+    return _index
+
+
+def render_sidebar_search(st):
+    """Sidebar search box; choosing a result opens that chapter in its runner."""
+    query = st.text_input("Search chapters", placeholder="e.g. Heikin-Ashi", key="chapter_search")
+    if not query:
+        return
+    results = get_index().search(query, limit=8)
+    if not results:
+        st.caption("No matches.")
+        return
+    for i, hit in enumerate(results):
+        label = f"{hit['chapter']}" + (f" › {hit['section']}" if hit["section"] else "")
+        if st.button(label, key=f"search_hit_{i}", help=hit["snippet"], use_container_width=True):
+            page, selector = MODULES[hit["folder"]]
+            st.session_state[selector] = hit["chapter"]
+            st.switch_page(page)
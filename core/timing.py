@@ -0,0 +1,149 @@
+"""
+Timing spans for the chapter loader and the figure pipeline.
+
+Spans are off unless ``APP_TIMING`` is set in the environment or an admin
+opens the app with ``?admin=<APP_ADMIN_TOKEN>``. While off, `span` returns a
+shared no-op context manager, so an instrumented chapter costs one function
+call per span.
+
+While on, every span is written as one JSON line to the ``core.timing`` logger
+(stderr, or the file named by ``APP_TIMING_LOG``) and kept in a rolling window
+per (chapter, span). `render_panel` shows p50/p95 over that window.
+"""
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+WINDOW = 200
+
+ENABLED = bool(os.environ.get("APP_TIMING"))
+ADMIN_TOKEN = os.environ.get("APP_ADMIN_TOKEN")
+
+logger = logging.getLogger(__name__)
+_NOOP = contextlib.nullcontext()
+_local = threading.local()
+_samples = defaultdict(lambda: deque(maxlen=WINDOW))
+_samples_lock = threading.Lock()
+
+
+def _configure_logger():
+    if logger.handlers:
+        return
+    path = os.environ.get("APP_TIMING_LOG")
+    handler = logging.FileHandler(path) if path else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def is_enabled():
+    """True when spans are being recorded for the current script run."""
+    return ENABLED or getattr(_local, "admin", False)
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def span(name):
+    """Context manager timing the enclosed block as `name` within the current chapter."""
+    if not is_enabled():
+        return _NOOP
+    return _Span(name)
+
+
+def record(name, seconds):
+    chapter = getattr(_local, "chapter", None) or "-"
+    with _samples_lock:
+        _samples[(chapter, name)].append(seconds)
+    _configure_logger()
+    logger.info(json.dumps({"ts": time.time(), "chapter": chapter, "span": name, "ms": round(seconds * 1000, 3)}))
+
+
+@contextlib.contextmanager
+def chapter(name):
+    """Attributes the spans opened inside the block to chapter `name`."""
+    previous = getattr(_local, "chapter", None)
+    _local.chapter = name
+    try:
+        yield
+    finally:
+        _local.chapter = previous
+
+
+def instrument(owner, attr, name=None):
+    """Wraps `owner.attr` once so each call is recorded as a span (e.g. st.plotly_chart)."""
+    func = getattr(owner, attr)
+    if getattr(func, "_timed", False):
+        return
+    name = name or attr
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        if not is_enabled():
+            return func(*args, **kwargs)
+        with _Span(name):
+            return func(*args, **kwargs)
+
+    timed._timed = True
+    setattr(owner, attr, timed)
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def summary():
+    """Per (chapter, span) count, p50 and p95 in milliseconds over the rolling window."""
+    with _samples_lock:
+        items = [(key, sorted(values)) for key, values in _samples.items()]
+    rows = []
+    for (chapter_name, span_name), ordered in sorted(items):
+        rows.append({
+            "chapter": chapter_name,
+            "span": span_name,
+            "count": len(ordered),
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+        })
+    return rows
+
+
+def admin_requested(st):
+    """
+    Turns spans on for this script run if the admin token is in the query string.
+    Call at the top of a page runner; returns whether the admin panel should show.
+    """
+    token = st.query_params.get("admin")
+    _local.admin = bool(ADMIN_TOKEN) and token == ADMIN_TOKEN
+    return _local.admin
+
+
+def render_panel(st):
+    """Sidebar panel with the rolling p50/p95 table."""
+    with st.sidebar.expander("⏱️ Performance (admin)"):
+        rows = summary()
+        if not rows:
+            st.caption("No spans recorded yet.")
+            return
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        if st.button("Reset timings"):
+            with _samples_lock:
+                _samples.clear()
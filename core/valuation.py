@@ -0,0 +1,148 @@
+"""
+Monte Carlo intrinsic value (discounted cash flow).
+
+Each path draws a revenue growth rate, a free-cash-flow margin and a discount
+rate, projects `years` of free cash flow, adds a Gordon-growth terminal value
+and converts the enterprise value to a value per share. Projected cash flows
+grow geometrically, so the sum over the forecast years is taken in closed form
+instead of looping year by year; a whole (companies x paths) block is a few
+array operations.
+
+`simulate` values a single company in-process and is fast enough to rerun on
+every slider move. `value_universe` batches many companies and spreads the
+batches over a process pool, returning only the summaries.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Draws per (companies x paths) block in `value_universe`; each worker holds
+# about a dozen float64 arrays of this size at once (~200 MB at 2M)
+BLOCK_VALUES = 2_000_000
+
+
+def _annuity_factor(q, years):
+    """sum(q ** t for t in 1..years), stable when q is close to 1."""
+    near_one = np.abs(q - 1.0) < 1e-9
+    safe_q = np.where(near_one, 0.5, q)
+    factor = safe_q * (1.0 - safe_q ** years) / (1.0 - safe_q)
+    return np.where(near_one, float(years), factor)
+
+
+def intrinsic_values(revenue, shares, net_cash, growth, margin, discount,
+                     years=10, terminal_growth=0.025):
+    """
+    Value per share for each draw. Company inputs broadcast against the
+    (..., paths) arrays of growth, margin and discount rate.
+    """
+    revenue = np.asarray(revenue, dtype=float)[..., np.newaxis]
+    shares = np.asarray(shares, dtype=float)[..., np.newaxis]
+    net_cash = np.asarray(net_cash, dtype=float)[..., np.newaxis]
+    # Terminal value is only defined while the discount rate beats terminal growth
+    discount = np.maximum(discount, terminal_growth + 0.01)
+
+    q = (1.0 + growth) / (1.0 + discount)
+    fcf_now = revenue * margin
+    explicit = fcf_now * _annuity_factor(q, years)
+    final_fcf = fcf_now * (1.0 + growth) ** years
+    terminal = final_fcf * (1.0 + terminal_growth) / (discount - terminal_growth)
+    enterprise = explicit + terminal / (1.0 + discount) ** years
+    return (enterprise + net_cash) / shares
+
+
+def draw_assumptions(rng, shape, growth=(0.06, 0.04), margin=(0.12, 0.03), discount=(0.09, 0.015)):
+    """Draws normal (mean, std) growth, margin and discount-rate samples of `shape`."""
+    return (
+        rng.normal(growth[0], growth[1], shape),
+        rng.normal(margin[0], margin[1], shape),
+        rng.normal(discount[0], discount[1], shape),
+    )
+
+
+def summarize(values, price):
+    """Percentiles, mean and the probability of being under/over-valued at `price`."""
+    price = np.asarray(price, dtype=float)[..., np.newaxis]
+    pct = np.percentile(values, PERCENTILES, axis=-1)
+    return {
+        "mean": values.mean(axis=-1),
+        "percentiles": dict(zip(PERCENTILES, pct)),
+        "prob_undervalued": (values > price).mean(axis=-1),
+        "prob_overvalued": (values < price).mean(axis=-1),
+    }
+
+
+def simulate(revenue, shares, net_cash, price, n_paths=200_000, seed=None,
+             years=10, terminal_growth=0.025, **assumptions):
+    """Values one company; returns `summarize` output plus the sampled values."""
+    rng = np.random.default_rng(seed)
+    growth, margin, discount = draw_assumptions(rng, n_paths, **assumptions)
+    values = intrinsic_values(revenue, shares, net_cash, growth, margin, discount,
+                              years, terminal_growth)
+    result = summarize(values, price)
+    result["values"] = values
+    return result
+
+
+def _value_batch(args):
+    """Process-pool task: values one batch of companies, returns summaries only."""
+    inputs, n_paths, seed, years, terminal_growth, chunk = args
+    rng = np.random.default_rng(seed)
+    n = len(inputs["revenue"])
+    out = {"mean": np.empty(n), "prob_undervalued": np.empty(n), "prob_overvalued": np.empty(n),
+           "percentiles": {p: np.empty(n) for p in PERCENTILES}}
+    # Chunk companies so a (chunk x n_paths) block stays within BLOCK_VALUES draws
+    for start in range(0, n, chunk):
+        sl = slice(start, start + chunk)
+        k = len(inputs["revenue"][sl])
+        growth = rng.normal(inputs["growth"][sl, None], inputs["growth_std"][sl, None], (k, n_paths))
+        margin = rng.normal(inputs["margin"][sl, None], inputs["margin_std"][sl, None], (k, n_paths))
+        discount = rng.normal(inputs["discount"][sl, None], inputs["discount_std"][sl, None], (k, n_paths))
+        values = intrinsic_values(inputs["revenue"][sl], inputs["shares"][sl], inputs["net_cash"][sl],
+                                  growth, margin, discount, years, terminal_growth)
+        summary = summarize(values, inputs["price"][sl])
+        for key in ("mean", "prob_undervalued", "prob_overvalued"):
+            out[key][sl] = summary[key]
+        for p in PERCENTILES:
+            out["percentiles"][p][sl] = summary["percentiles"][p]
+    return out
+
+
+DEFAULT_SPREADS = {"growth_std": 0.04, "margin_std": 0.03, "discount_std": 0.015}
+
+
+def value_universe(revenue, shares, net_cash, price, growth, margin, discount=0.09,
+                   n_paths=100_000, seed=None, years=10, terminal_growth=0.025,
+                   max_workers=None, batch_size=64, **spreads):
+    """
+    Values many companies at once. Every input is a per-company array (or a scalar
+    applied to all); `spreads` overrides the *_std defaults. Returns a dict of
+    per-company arrays like `summarize`.
+    """
+    n = len(np.atleast_1d(revenue))
+    inputs = {"revenue": revenue, "shares": shares, "net_cash": net_cash, "price": price,
+              "growth": growth, "margin": margin, "discount": discount}
+    inputs.update({k: spreads.get(k, v) for k, v in DEFAULT_SPREADS.items()})
+    inputs = {k: np.broadcast_to(np.asarray(v, dtype=float), n) for k, v in inputs.items()}
+
+    chunk = max(1, BLOCK_VALUES // n_paths)
+    seeds = np.random.SeedSequence(seed).spawn((n + batch_size - 1) // batch_size)
+    tasks = [
+        ({k: v[i:i + batch_size] for k, v in inputs.items()}, n_paths, s, years, terminal_growth, chunk)
+        for i, s in zip(range(0, n, batch_size), seeds)
+    ]
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) == 1:
+        parts = [_value_batch(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            parts = list(pool.map(_value_batch, tasks))
+
+    return {
+        "mean": np.concatenate([p["mean"] for p in parts]),
+        "prob_undervalued": np.concatenate([p["prob_undervalued"] for p in parts]),
+        "prob_overvalued": np.concatenate([p["prob_overvalued"] for p in parts]),
+        "percentiles": {q: np.concatenate([p["percentiles"][q] for p in parts]) for q in PERCENTILES},
+    }
@@ -2,20 +2,31 @@ import streamlit as st
 import os
 import importlib.util
 import sys
+from core import chapters, prefetch, prewarm, search, timing
+
+# Time every chart's serialization; a no-op check unless timing is on
+timing.instrument(st, "plotly_chart")
+prewarm.start()
+
+# Chapters run as this module; prefetch must use the same name to share their caches
+MODULE_NAME = "dynamic_chapter"
 
 def load_module(filepath):
     try:
-        # Create a module spec
-        spec = importlib.util.spec_from_file_location("dynamic_chapter", filepath)
-        if spec and spec.loader:
-            # Create a new module based on the spec
-            module = importlib.util.module_from_spec(spec)
-            # Execute the module
-            spec.loader.exec_module(module)
+        with timing.span("load_module"):
+            # Create a module spec
+            spec = importlib.util.spec_from_file_location(MODULE_NAME, filepath)
+            if spec and spec.loader:
+                # Create a new module based on the spec
+                module = importlib.util.module_from_spec(spec)
+                # Execute the module, reusing code compiled by an earlier visit or prefetch
+                exec(prefetch.compiled(filepath), module.__dict__)
     except Exception as e:
         st.error(f"Error loading chapter: {e}")
 
 def fundamentals():
+    show_timings = timing.admin_requested(st)
+
     with st.sidebar:
         st.page_link("Landing_Page.py", label="Back to Home", icon="🏠")
         
@@ -70,6 +81,7 @@ def fundamentals():
         """, unsafe_allow_html=True)
         
         st.title("Fundamental Analysis")
+        search.render_sidebar_search(st)
         
         # Define the folder path relative to the main app execution directory
         # Since we run from 'streamlit/', the folder is 'Fundamental'
@@ -83,22 +95,24 @@ def fundamentals():
                  st.error(f"Could not find 'Fundamental' folder.")
                  return
 
-        # List python files
+        # Chapters in reading order, from the shared manifest
         try:
-            files = [f for f in os.listdir(folder_path) if f.endswith('.py') and f != "__init__.py"]
-            files.sort() # Sort alphabetically
+            chapter_map = chapters.chapter_files(folder_path)
         except Exception as e:
             st.error(f"Error reading folder: {e}")
             return
-        
-        if not files:
+
+        if not chapter_map:
             st.warning("No chapters found.")
             return
 
-        # Create friendly names (remove extension)
-        chapter_map = {f.replace('.py', ''): f for f in files}
         chapter_names = list(chapter_map.keys())
         
+        # Deep link (e.g. from the static export): ?chapter=<name> opens that chapter
+        linked_chapter = st.query_params.get("chapter")
+        if linked_chapter in chapter_names and "fund_chapter_selector" not in st.session_state:
+            st.session_state.fund_chapter_selector = linked_chapter
+
         # Initialize session state for chapter selection if not exists
         if "fund_chapter_selector" not in st.session_state:
             st.session_state.fund_chapter_selector = chapter_names[0]
@@ -125,7 +139,8 @@ def fundamentals():
     if selected_chapter_name:
         filename = chapter_map[selected_chapter_name]
         file_path = os.path.join(folder_path, filename)
-        load_module(file_path)
+        with timing.chapter(f"Fundamental/{selected_chapter_name}"):
+            load_module(file_path)
         
         # Navigation Buttons
         st.write("---") # Divider
@@ -135,6 +150,8 @@ def fundamentals():
         
         # Next Button
         if current_index < len(chapter_names) - 1:
+            # Warm the next chapter in the background while this one is read
+            prefetch.schedule(os.path.join(folder_path, chapter_map[chapter_names[current_index + 1]]), MODULE_NAME)
             with col3:
                 def go_to_next_chapter_fund():
                     curr_idx = chapter_names.index(st.session_state.fund_chapter_selector)
@@ -143,5 +160,8 @@ def fundamentals():
                 
                 st.button("Next Chapter →", on_click=go_to_next_chapter_fund)
 
+    if show_timings:
+        timing.render_panel(st)
+
 if __name__ == "__main__":
     fundamentals()
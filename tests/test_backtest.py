@@ -0,0 +1,90 @@
+import threading
+
+import numpy as np
+import pytest
+
+from core import backtest as bt
+
+
+def _reference_positions(prices, window):
+    """Bar-by-bar loop of the Tenet 6 rule with one confirming close."""
+    resistance = support = np.nan
+    position = np.zeros(len(prices))
+    current = 0.0
+    for t in range(len(prices)):
+        # The pivot at bar p = t - window is known once bar t has printed
+        p = t - window
+        if p >= window:
+            block = prices[p - window:p + window + 1]
+            if prices[p] == block.max():
+                resistance = prices[p]
+            if prices[p] == block.min():
+                support = prices[p]
+        if prices[t] > resistance:
+            current = 1.0
+        elif prices[t] < support:
+            current = -1.0
+        position[t] = current
+    return position
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(3)
+    return 100 + np.cumsum(rng.normal(0, 1, (4, 300)), axis=1)
+
+
+def test_positions_match_bar_by_bar_loop_with_single_confirm(prices):
+    for row in prices:
+        expected = _reference_positions(row, 5)
+        np.testing.assert_array_equal(bt.dow_positions(row, 5, 1, True)[0], expected)
+
+
+def test_long_only_never_shorts(prices):
+    pos = bt.dow_positions(prices, 5, 2, allow_short=False)
+    assert set(np.unique(pos)) <= {0.0, 1.0}
+
+
+def test_performance_matches_explicit_equity_curve(prices):
+    result = bt.backtest(prices, window=4, confirm_bars=2)
+    pos = result["position"]
+    for i, row in enumerate(prices):
+        equity = 1.0
+        for t in range(1, row.size):
+            equity *= 1.0 + pos[i, t - 1] * (row[t] / row[t - 1] - 1.0)
+        assert result["total_return"][i] == pytest.approx(equity - 1.0)
+    assert (result["max_drawdown"] <= 0).all()
+
+
+def test_sweep_in_process_matches_backtest(prices):
+    grid = bt.param_grid(window=[3, 6], confirm_bars=[1, 2])
+    results = bt.sweep(prices, grid, max_workers=1)
+    assert [p for p, _ in results] == grid
+    for params, summary in results:
+        np.testing.assert_allclose(summary["total_return"], bt.backtest(prices, **params)["total_return"])
+
+
+def test_concurrent_in_process_sweeps_keep_their_own_prices(prices):
+    grid = bt.param_grid(window=[3, 4, 5, 6], confirm_bars=[1, 2])
+    inputs = [prices, prices[::-1] * 2]
+    outputs = [None, None]
+
+    def run(i):
+        outputs[i] = bt.sweep(inputs[i], grid, max_workers=1)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for i, results in enumerate(outputs):
+        for params, summary in results:
+            np.testing.assert_allclose(summary["total_return"], bt.backtest(inputs[i], **params)["total_return"])
+
+
+def test_sweep_process_pool_matches_in_process(prices):
+    grid = bt.param_grid(window=[3, 5], confirm_bars=[1])
+    pooled = bt.sweep(prices, grid, max_workers=2)
+    local = bt.sweep(prices, grid, max_workers=1)
+    for (_, a), (_, b) in zip(pooled, local):
+        np.testing.assert_allclose(a["total_return"], b["total_return"])
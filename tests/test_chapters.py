@@ -0,0 +1,23 @@
+import os
+
+from core import chapters
+
+
+def test_chapter_files_are_sorted_scripts_without_init(tmp_path):
+    for name in ["b.py", "a.py", "__init__.py", "notes.md"]:
+        (tmp_path / name).write_text("")
+    assert chapters.chapter_files(str(tmp_path)) == {"a": "a.py", "b": "b.py"}
+
+
+def test_manifest_covers_every_module_in_reading_order(tmp_path):
+    for folder in chapters.MODULES:
+        os.makedirs(tmp_path / folder)
+        (tmp_path / folder / "Chapter2.py").write_text("")
+        (tmp_path / folder / "Chapter1.py").write_text("")
+    found = [(folder, name) for folder, name, _ in chapters.manifest(str(tmp_path))]
+    assert found == [(folder, f"Chapter{i}") for folder in chapters.MODULES for i in (1, 2)]
+
+
+def test_page_url_deep_links_into_the_runner():
+    url = chapters.page_url("Technical", "Chapter 4 - Dow Theory", "https://example.com/")
+    assert url == "https://example.com/Technical?chapter=Chapter%204%20-%20Dow%20Theory"
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from core import correlation as cor
+
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(2)
+    market = rng.normal(0, 0.01, 400)
+    return 0.8 * market + rng.normal(0, 0.01, (6, 400))
+
+
+@pytest.mark.parametrize("step, rebase", [(1, 250), (7, 3), (25, 250)])
+def test_rolling_matches_corrcoef(returns, step, rebase):
+    window = 40
+    ends = []
+    for end, matrix in cor.rolling_correlation(returns, window, step=step, rebase=rebase):
+        ends.append(end)
+        np.testing.assert_allclose(matrix, np.corrcoef(returns[:, end - window + 1:end + 1]), atol=1e-9)
+    assert ends == list(range(window - 1, returns.shape[1], step))
+
+
+def test_correlation_at_and_streaming_match_corrcoef(returns):
+    window = 30
+    stream = cor.RollingCorrelation(returns.shape[0], window)
+    for t in range(returns.shape[1]):
+        matrix = stream.update(returns[:, t])
+        if t < window - 1:
+            assert matrix is None
+            continue
+        expected = np.corrcoef(returns[:, t - window + 1:t + 1])
+        np.testing.assert_allclose(matrix, expected, atol=1e-8)
+        if t % 50 == 0:
+            np.testing.assert_allclose(cor.correlation_at(returns, t, window), expected, atol=1e-12)
+
+
+def test_window_longer_than_history_yields_nothing(returns):
+    assert list(cor.rolling_correlation(returns, returns.shape[1] + 1)) == []
+
+
+def test_relative_strength_ranks_performance():
+    prices = np.array([
+        [100.0, 110.0, 120.0],
+        [100.0, 90.0, 80.0],
+        [100.0, 100.0, 130.0],
+    ])
+    perf, ranks = cor.relative_strength(prices, 1)
+    np.testing.assert_allclose(perf[:, 1], [0.1, -0.1, 0.0])
+    np.testing.assert_allclose(ranks[:, 1], [1.0, 1 / 3, 2 / 3])
+    np.testing.assert_allclose(ranks[:, 2], [2 / 3, 1 / 3, 1.0])
+    assert np.isnan(ranks[:, 0]).all()
+
+
+def test_relative_strength_leaves_unlisted_symbols_unranked():
+    prices = np.array([
+        [np.nan, np.nan, 50.0, 60.0],   # lists at bar 2
+        [100.0, 101.0, 102.0, 103.0],
+        [100.0, 95.0, 90.0, 85.0],
+    ])
+    perf, ranks = cor.relative_strength(prices, 1, chunk=2)
+    assert np.isnan(ranks[0, :3]).all()
+    np.testing.assert_allclose(ranks[1:, 1], [1.0, 0.5])
+    np.testing.assert_allclose(ranks[:, 3], [1.0, 2 / 3, 1 / 3])
+
+
+def test_leading_order_groups_correlated_blocks():
+    rng = np.random.default_rng(4)
+    a, b = rng.normal(size=(2, 500))
+    series = np.array([a, b, a, b]) + rng.normal(0, 0.1, (4, 500))
+    order = list(cor.leading_order(np.corrcoef(series)))
+    pos = {s: order.index(s) for s in range(4)}
+    assert abs(pos[0] - pos[2]) == 1 and abs(pos[1] - pos[3]) == 1
@@ -0,0 +1,93 @@
+import os
+import re
+
+import pytest
+
+from core import export
+
+CHAPTER = '''
+import streamlit as st
+import plotly.graph_objects as go
+
+st.title("Dow Theory")
+st.markdown("A payload with a literal </script> inside")
+st.info("Averages must confirm")
+tab1, tab2 = st.tabs(["Tenet 1", "Tenet 2"])
+with tab1:
+    st.slider("Slope", 0, 10, 5)
+    st.radio("Mode", ["a", "b"])
+    st.button("Go")
+with tab2:
+    col1, col2 = st.columns(2)
+    col1.metric("Return", "12%")
+    col2.plotly_chart(go.Figure(go.Scatter(y=[1, 2], name="</script><b>x")))
+'''
+
+
+def _chapter(path, text=CHAPTER):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return str(path)
+
+
+@pytest.fixture
+def rendered(tmp_path):
+    return export.render_chapter(_chapter(tmp_path / "chapter.py"), "https://app.example/Technical?chapter=X")
+
+
+def test_renderer_keeps_structure(rendered):
+    assert "<h1>Dow Theory</h1>" in rendered
+    assert re.findall(r'<h2 class="tab-label">([^<]+)</h2>', rendered) == ["Tenet 1", "Tenet 2"]
+    assert '<div class="alert info">' in rendered
+    assert '<div class="row"><div><div class="metric">Return<b>12%</b></div></div><div>' in rendered
+    assert 'class="figure"' in rendered
+
+
+def test_payloads_cannot_close_their_script_tag(rendered):
+    # Only the real closing tags remain; escaped ones read <\/script>
+    opened = rendered.count("<script")
+    assert rendered.count("</script>") == opened
+    assert r"<\/script>" in rendered
+
+
+def test_one_live_link_per_widget_group(rendered):
+    assert rendered.count('class="widget"') == 1
+    assert 'href="https://app.example/Technical?chapter=X"' in rendered
+
+
+def test_no_live_links_without_app_url(tmp_path):
+    html = export.render_chapter(_chapter(tmp_path / "chapter.py"), None)
+    assert 'class="widget"' in html and "href" not in html
+
+
+def _site(tmp_path):
+    root = tmp_path / "app"
+    _chapter(root / "Technical" / "Chapter 1 - Intro.py", "import streamlit as st\nst.title('One')\n")
+    _chapter(root / "Technical" / "Chapter 2 - Next.py", "import streamlit as st\nst.title('Two')\n")
+    _chapter(root / "Fundamental" / "Chapter1.py", "import streamlit as st\nst.title('Basics')\n")
+    return str(root)
+
+
+def test_export_site_writes_pages_index_and_navigation(tmp_path):
+    out = tmp_path / "site"
+    written = export.export_site(str(out), root=_site(tmp_path))
+    names = sorted(os.path.relpath(p, out) for p in written)
+    assert names == ["Fundamental/chapter1.html", "Technical/chapter-1-intro.html",
+                     "Technical/chapter-2-next.html", "index.html"]
+    first = (out / "Technical" / "chapter-1-intro.html").read_text()
+    last = (out / "Technical" / "chapter-2-next.html").read_text()
+    assert 'href="chapter-2-next.html">Next Chapter' in first
+    assert "Next Chapter" not in last
+    # No app URL: nothing points at a live app the static server cannot serve
+    assert "live app" not in first
+    index = (out / "index.html").read_text()
+    assert 'href="Technical/chapter-2-next.html"' in index and "interactive app" not in index
+
+
+def test_export_site_links_into_the_live_app(tmp_path):
+    out = tmp_path / "site"
+    export.export_site(str(out), app_url="https://learn.example.com", root=_site(tmp_path))
+    page = (out / "Technical" / "chapter-1-intro.html").read_text()
+    assert 'href="https://learn.example.com/Technical?chapter=Chapter%201%20-%20Intro"' in page
+    assert 'href="https://learn.example.com"' in (out / "index.html").read_text()
@@ -0,0 +1,128 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core import fundamentals as fd
+
+
+@pytest.fixture
+def statements():
+    return fd.sample_statements(n_companies=20, n_periods=3, seed=5)
+
+
+def _row_ratios(inc, bal, cf, price, prior_inc):
+    """Ratios for one (company, period) row written out line item by line item."""
+    eps = inc["net_income"] / inc["shares_outstanding"]
+    fcf = cf["operating_cash_flow"] - abs(cf["capital_expenditure"])
+    return {
+        "eps": eps,
+        "pe": price / eps if eps > 0 else np.nan,
+        "pb": price * inc["shares_outstanding"] / bal["total_equity"],
+        "roe": inc["net_income"] / bal["total_equity"],
+        "roa": inc["net_income"] / bal["total_assets"],
+        "debt_to_equity": bal["total_debt"] / bal["total_equity"],
+        "current_ratio": bal["current_assets"] / bal["current_liabilities"],
+        "gross_margin": (inc["revenue"] - inc["cost_of_revenue"]) / inc["revenue"],
+        "operating_margin": inc["operating_income"] / inc["revenue"],
+        "net_margin": inc["net_income"] / inc["revenue"],
+        "fcf_margin": fcf / inc["revenue"],
+        "revenue_growth": np.nan if prior_inc is None else
+        (inc["revenue"] - prior_inc["revenue"]) / abs(prior_inc["revenue"]),
+        "earnings_growth": np.nan if prior_inc is None else
+        (inc["net_income"] - prior_inc["net_income"]) / abs(prior_inc["net_income"]),
+    }
+
+
+def test_ratios_match_row_by_row_formulas(statements):
+    ratios = fd.sample_store(n_companies=20, n_periods=3, seed=5).ratios()
+    tables = {k: v.set_index(fd.KEYS) for k, v in statements.items()}
+    for _, row in ratios.iterrows():
+        key = (row["company"], row["period"])
+        prior = (row["company"], row["period"] - 1)
+        expected = _row_ratios(
+            tables["income_statement"].loc[key], tables["balance_sheet"].loc[key],
+            tables["cash_flow"].loc[key], tables["prices"].loc[key, "price"],
+            tables["income_statement"].loc[prior] if prior in tables["income_statement"].index else None,
+        )
+        for name, value in expected.items():
+            assert row[name] == pytest.approx(value, nan_ok=True), name
+
+
+def test_missing_line_items_and_zero_denominators_give_nan():
+    frame = pd.DataFrame({
+        "company": ["A", "A", "B"],
+        "period": [2021, 2020, 2020],
+        "revenue": [0.0, 50.0, 10.0],
+        "net_income": [5.0, 4.0, -1.0],
+        "shares_outstanding": [10.0, 10.0, 0.0],
+    })
+    store = fd.FundamentalsStore(frame)
+    ratios = store.ratios()
+    assert list(ratios["company"]) == ["A", "A", "B"]
+    assert list(ratios["period"]) == [2020, 2021, 2020]
+    # No price file: valuation ratios are NaN rather than an error
+    assert ratios["pe"].isna().all()
+    # Zero revenue and zero shares give NaN, never inf
+    assert np.isnan(ratios["net_margin"][1])
+    assert np.isnan(ratios["eps"][2])
+    assert ratios["revenue_growth"].tolist()[1] == pytest.approx(-1.0)
+    assert np.isnan(ratios["revenue_growth"][2])
+    assert store.ratios() is ratios
+
+
+def test_negative_equity_ratios_are_nan_and_fail_screens():
+    frame = pd.DataFrame({
+        "company": ["INSOLVENT", "HEALTHY"],
+        "period": [2023, 2023],
+        "net_income": [-50.0, 30.0],
+        "shares_outstanding": [10.0, 10.0],
+        "total_equity": [-100.0, 100.0],
+        "total_debt": [500.0, 20.0],
+        "price": [5.0, 40.0],
+    })
+    store = fd.FundamentalsStore(frame)
+    ratios = store.ratios().set_index("company")
+    for name in ("roe", "debt_to_equity", "pb"):
+        assert np.isnan(ratios.loc["INSOLVENT", name]), name
+    assert ratios.loc["HEALTHY", "roe"] == pytest.approx(0.3)
+    rows = store.screener().query("roe > 20% and debt_to_equity < 0.5")
+    assert list(store.screener().labels[rows]) == ["HEALTHY"]
+
+
+def test_text_columns_are_ignored_and_bad_numbers_become_nan(tmp_path):
+    pd.DataFrame({
+        "company": ["A", "B"],
+        "period": [2023, 2023],
+        "currency": ["USD", "EUR"],
+        "fiscal_date_ending": ["2023-12-31", "2023-06-30"],
+        "revenue": ["100", "n/a"],
+        "net_income": [10.0, 5.0],
+        "shares_outstanding": [5, 5],
+    }).to_csv(tmp_path / "income_statement.csv", index=False)
+    store = fd.read_statements(str(tmp_path))
+    assert "currency" not in store and "fiscal_date_ending" not in store
+    np.testing.assert_allclose(store.column("revenue"), [100.0, np.nan])
+    np.testing.assert_allclose(store.ratios()["net_margin"], [0.1, np.nan])
+
+
+def test_load_store_reloads_only_when_files_change(tmp_path):
+    fd.write_sample_files(str(tmp_path), n_companies=5, n_periods=2)
+    first = fd.load_store(str(tmp_path))
+    assert fd.load_store(str(tmp_path)) is first
+    assert len(first) == 10 and "price" in first
+
+    path = os.path.join(str(tmp_path), "prices.csv")
+    prices = pd.read_csv(path)
+    prices["price"] *= 2
+    prices.to_csv(path, index=False)
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10**9))
+    second = fd.load_store(str(tmp_path))
+    assert second is not first
+    np.testing.assert_allclose(second.column("price"), first.column("price") * 2)
+
+
+def test_missing_directory_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        fd.read_statements(str(tmp_path))
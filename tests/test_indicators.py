@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from core import indicators as ind
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, (3, 120)), axis=1)
+    high = close + rng.uniform(0, 1, close.shape)
+    low = close - rng.uniform(0, 1, close.shape)
+    return high, low, close
+
+
+def _stream(state, *columns):
+    """Feeds a state one bar (column) at a time and stacks the results back to (symbols x time)."""
+    steps = [state.update(*(c[:, t] for c in columns)) for t in range(columns[0].shape[1])]
+    if isinstance(steps[0], tuple):
+        return tuple(np.stack([s[i] for s in steps], axis=1) for i in range(len(steps[0])))
+    return np.stack(steps, axis=1)
+
+
+def _assert_same(batch, stream):
+    if isinstance(batch, tuple):
+        for b, s in zip(batch, stream):
+            _assert_same(b, s)
+        return
+    np.testing.assert_array_equal(np.isnan(batch), np.isnan(stream))
+    np.testing.assert_allclose(batch, stream, equal_nan=True, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("batch, state", [
+    (lambda c: ind.sma(c, 10), lambda: ind.SMAState(10, 3)),
+    (lambda c: ind.ema(c, 10), lambda: ind.EMAState(10, 3)),
+    (lambda c: ind.rsi(c, 14), lambda: ind.RSIState(14, 3)),
+    (lambda c: ind.macd(c, 12, 26, 9), lambda: ind.MACDState(12, 26, 9, 3)),
+    (lambda c: ind.bollinger(c, 20), lambda: ind.BollingerState(20, n_symbols=3)),
+])
+def test_batch_matches_state_bar_for_bar(bars, batch, state):
+    close = bars[2]
+    _assert_same(batch(close), _stream(state(), close))
+
+
+def test_atr_matches_state_bar_for_bar(bars):
+    high, low, close = bars
+    _assert_same(ind.atr(high, low, close, 14), _stream(ind.ATRState(14, 3), high, low, close))
+
+
+def test_sma_matches_rolling_mean(bars):
+    close = bars[2][0]
+    expected = np.convolve(close, np.ones(5) / 5, mode="valid")
+    np.testing.assert_allclose(ind.sma(close, 5)[4:], expected)
+
+
+def test_single_series_matches_matrix_row(bars):
+    close = bars[2]
+    np.testing.assert_allclose(ind.rsi(close[1]), ind.rsi(close)[1], equal_nan=True)
+
+
+@pytest.mark.parametrize("call", [
+    lambda c: ind.sma(c, 0),
+    lambda c: ind.ema(c, 0),
+    lambda c: ind.rsi(c, 0),
+    lambda c: ind.macd(c, signal=0),
+    lambda c: ind.EMAState(0),
+    lambda c: ind.SMAState(0),
+])
+def test_invalid_periods_raise(bars, call):
+    with pytest.raises(ValueError):
+        call(bars[2])
+
+
+def test_out_buffers_are_filled_in_place(bars):
+    close = bars[2]
+    buf = np.empty_like(close)
+    assert ind.ema(close, 10, out=buf) is buf
+    macd_out = tuple(np.empty_like(close) for _ in range(3))
+    for got, want in zip(ind.macd(close, out=macd_out), ind.macd(close)):
+        np.testing.assert_allclose(got, want, equal_nan=True)
+    np.testing.assert_allclose(macd_out[2], ind.macd(close)[2], equal_nan=True)
+    band_out = tuple(np.empty_like(close[0]) for _ in range(3))
+    ind.bollinger(close[0], out=band_out)
+    for got, want in zip(band_out, ind.bollinger(close[0])):
+        np.testing.assert_allclose(got, want, equal_nan=True)
+    with pytest.raises(ValueError):
+        ind.macd(close, out=(buf,))
+
+
+def test_indicator_set_caches_results(bars):
+    high, low, close = bars
+    s = ind.IndicatorSet(close, high, low, symbols=["A", "B", "C"])
+    assert s.compute("SMA", window=5) is s.compute("SMA", window=5)
+    np.testing.assert_allclose(s.get("ATR", "B"), ind.atr(high[1], low[1], close[1]), equal_nan=True)
+    with pytest.raises(ValueError):
+        ind.IndicatorSet(close).compute("ATR")
+
+
+def test_oscillators_go_on_secondary_axis(bars):
+    go = pytest.importorskip("plotly.graph_objects")
+    close = bars[2][0]
+    fig = ind.add_overlays(go.Figure(), np.arange(close.size), {
+        "SMA 20": ind.sma(close, 20),
+        "RSI 14": ind.rsi(close, 14),
+        "MACD": ind.macd(close),
+    })
+    axes = {t.name: t.yaxis for t in fig.data}
+    assert axes["SMA 20"] == "y"
+    assert axes["RSI 14"] == "y2"
+    assert axes["MACD (1)"] == axes["MACD (3)"] == "y2"
+    assert fig.layout.yaxis2.overlaying == "y"
@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import time
+
+import pytest
+
+from core import prefetch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_runner(page):
+    """Imports a page runner without rendering it (its page function runs only as __main__)."""
+    spec = importlib.util.spec_from_file_location("runner_under_test", os.path.join(ROOT, page))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _wait_idle(timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while prefetch._worker is not None:
+        assert time.monotonic() < deadline, "prefetch did not finish"
+        time.sleep(0.02)
+
+
+def _chapter(tmp_path, name="Chapter X.py"):
+    calls = tmp_path / (name + ".calls")
+    path = tmp_path / name
+    path.write_text(
+        "import streamlit as st\n\n"
+        "@st.cache_data\n"
+        "def expensive():\n"
+        f"    with open({str(calls)!r}, 'a') as f:\n"
+        "        f.write('x')\n"
+        "    return 42\n\n"
+        "st.write(expensive())\n"
+    )
+    return str(path), calls
+
+
+@pytest.mark.parametrize("page", ["pages/1_Fundamentals.py", "pages/2_Technical.py"])
+def test_prefetched_cache_entries_are_hit_by_the_real_load(tmp_path, page):
+    path, calls = _chapter(tmp_path)
+    runner = _load_runner(page)
+    assert prefetch.schedule(path, runner.MODULE_NAME)
+    _wait_idle()
+    assert calls.read_text() == "x"
+    runner.load_module(path)
+    assert calls.read_text() == "x"
+
+
+def test_each_file_version_is_prefetched_once(tmp_path):
+    path, calls = _chapter(tmp_path)
+    assert prefetch.schedule(path, "dynamic_chapter_once")
+    _wait_idle()
+    assert not prefetch.schedule(path, "dynamic_chapter_once")
+    assert calls.read_text() == "x"
+
+
+def test_no_budget_means_no_prefetch(tmp_path, monkeypatch):
+    monkeypatch.setattr(prefetch, "BUDGET_S", 0.0)
+    path, calls = _chapter(tmp_path)
+    assert not prefetch.schedule(path, "dynamic_chapter")
+    assert not calls.exists()
+
+
+def test_compiled_code_is_reused_until_the_file_changes(tmp_path):
+    path, _ = _chapter(tmp_path)
+    code = prefetch.compiled(path)
+    assert prefetch.compiled(path) is code
+    with open(path, "a") as f:
+        f.write("# edited\n")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert prefetch.compiled(path) is not code
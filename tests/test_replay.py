@@ -0,0 +1,65 @@
+import time
+
+import numpy as np
+
+from core.indicators import sma
+from core.replay import ReplayHub, ReplaySession, synthetic_bars
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def test_session_rows_match_batch_indicator():
+    bars = [next(b) for b in [synthetic_bars(seed=1)] for _ in range(60)]
+    session = ReplaySession(["SMA 20"])
+    for bar in bars:
+        session.advance(bar)
+    index, rows = session.rows_since()
+    assert index == list(range(60))
+    expected = sma([b["Close"] for b in bars], 20)
+    np.testing.assert_allclose([r["SMA 20"] for r in rows], expected, equal_nan=True)
+    assert session.rows_since(57)[0] == [58, 59]
+
+
+def test_limit_ends_an_endless_replay():
+    hub = ReplayHub()
+    session = hub.start("a", synthetic_bars(), bars_per_second=500, limit=10)
+    _wait_for(lambda: session.done)
+    assert session.bar_count == 10
+
+
+def test_unpolled_replay_stops_and_is_forgotten():
+    hub = ReplayHub(idle_timeout=0.2)
+    session = hub.start("a", synthetic_bars(), bars_per_second=200)
+    _wait_for(lambda: session.done)
+    _wait_for(lambda: hub.session("a") is None)
+    assert hub.active_count() == 0
+
+
+def test_polled_replay_keeps_running():
+    hub = ReplayHub(idle_timeout=0.2)
+    session = hub.start("a", synthetic_bars(), bars_per_second=200)
+    deadline = time.monotonic() + 0.6
+    while time.monotonic() < deadline:
+        session.rows_since()
+        time.sleep(0.05)
+    assert not session.done
+    hub.stop("a")
+    assert session.done and hub.session("a") is None
+
+
+def test_max_sessions_caps_running_replays():
+    hub = ReplayHub(max_sessions=2)
+    assert hub.start("a", synthetic_bars(), bars_per_second=50) is not None
+    assert hub.start("b", synthetic_bars(), bars_per_second=50) is not None
+    assert hub.start("c", synthetic_bars(), bars_per_second=50) is None
+    # Restarting an existing replay does not count against the cap
+    assert hub.start("a", synthetic_bars(), bars_per_second=50) is not None
+    hub.stop("a")
+    assert hub.start("c", synthetic_bars(), bars_per_second=50) is not None
+    hub.stop("b")
+    hub.stop("c")
@@ -0,0 +1,77 @@
+import operator
+
+import numpy as np
+import pytest
+
+from core.fundamentals import sample_store
+from core.screener import MetricIndex, Screener, parse_query
+
+OPS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "==": operator.eq}
+
+
+@pytest.fixture
+def screener():
+    rng = np.random.default_rng(11)
+    pe = rng.uniform(2, 40, 5000)
+    pe[rng.random(5000) < 0.05] = np.nan
+    roe = np.round(rng.normal(0.12, 0.1, 5000), 2)
+    de = rng.uniform(0, 3, 5000)
+    return Screener({"pe": pe, "roe": roe, "debt_to_equity": de})
+
+
+def _mask(screener, conditions):
+    mask = np.ones(len(screener), dtype=bool)
+    for metric, op, value in conditions:
+        with np.errstate(invalid="ignore"):
+            mask &= OPS[op](screener.columns[metric], value)
+    return np.flatnonzero(mask)
+
+
+@pytest.mark.parametrize("conditions", [
+    [("pe", "<", 15)],
+    [("pe", "<", 15), ("roe", ">", 0.2), ("debt_to_equity", "<", 0.5)],
+    [("roe", "==", 0.12)],
+    [("roe", ">=", 0.1), ("roe", "<=", 0.2), ("pe", ">", 10)],
+    [("pe", ">", 100)],
+    [],
+])
+def test_query_matches_boolean_mask(screener, conditions):
+    np.testing.assert_array_equal(screener.query(conditions), _mask(screener, conditions))
+
+
+def test_query_string_sort_and_limit(screener):
+    rows = screener.query("pe < 15 and roe > 20%", sort_by="roe", descending=True, limit=25)
+    expected = _mask(screener, [("pe", "<", 15), ("roe", ">", 0.2)])
+    assert set(rows) <= set(expected) and len(rows) == min(25, len(expected))
+    roe = screener.columns["roe"][rows]
+    assert (np.diff(roe) <= 0).all()
+    assert roe[0] == screener.columns["roe"][expected].max()
+
+
+@pytest.mark.parametrize("descending", [True, False])
+def test_rows_without_the_sort_metric_go_last(descending):
+    screener = Screener({"pe": [10.0, 12.0, 8.0, 14.0, 30.0], "roe": [0.1, np.nan, 0.3, np.nan, 0.5]})
+    rows = screener.query("pe < 15", sort_by="roe", descending=descending)
+    assert list(rows) == ([2, 0, 1, 3] if descending else [0, 2, 1, 3])
+
+
+def test_nan_never_matches():
+    index = MetricIndex([1.0, np.nan, 3.0])
+    assert index.range(">", 0) == (0, 2)
+    assert index.range("<", 10) == (0, 2)
+
+
+def test_parse_query_rejects_garbage():
+    assert parse_query("pe <= 15, roe > 20%") == [("pe", "<=", 15.0), ("roe", ">", 0.2)]
+    with pytest.raises(ValueError):
+        parse_query("pe is cheap")
+    with pytest.raises(KeyError):
+        Screener({"pe": [1.0]}).query("roe > 1")
+
+
+def test_store_builds_its_screener_once():
+    store = sample_store(n_companies=30, n_periods=2)
+    screener = store.screener()
+    assert store.screener() is screener
+    assert len(screener) == 30
+    assert sample_store(n_companies=30, n_periods=2).screener() is not screener
@@ -0,0 +1,108 @@
+import os
+import threading
+
+from core.chapters import MODULES
+from core.search import SearchIndex
+
+
+def _write(path, heading, body):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"import streamlit as st\nst.header({heading!r})\nst.write({body!r})\n")
+
+
+def _tree(tmp_path):
+    folder = tmp_path / list(MODULES)[1]
+    folder.mkdir()
+    _write(folder / "Chapter 1.py", "Candles", "Heikin-Ashi candles smooth the trend")
+    _write(folder / "Chapter 2.py", "Volume", "Volume confirms the trend")
+    return folder
+
+
+def test_search_ands_terms_and_prefix_matches_the_last(tmp_path):
+    _tree(tmp_path)
+    index = SearchIndex(str(tmp_path))
+    index.refresh()
+    assert {h["chapter"] for h in index.search("trend")} == {"Chapter 1", "Chapter 2"}
+    assert [h["chapter"] for h in index.search("volume conf")] == ["Chapter 2"]
+    assert index.search("volume heikin") == []
+
+
+def test_refresh_replaces_changed_and_drops_deleted_files(tmp_path):
+    folder = _tree(tmp_path)
+    index = SearchIndex(str(tmp_path))
+    index.refresh()
+    _write(folder / "Chapter 1.py", "Candles", "Renko bricks")
+    os.utime(folder / "Chapter 1.py", ns=(0, os.stat(folder / "Chapter 1.py").st_mtime_ns + 10**9))
+    os.remove(folder / "Chapter 2.py")
+    index.refresh()
+    assert index.search("heikin") == []
+    assert index.search("volume") == []
+    assert [h["chapter"] for h in index.search("renk")] == ["Chapter 1"]
+    # Prefix lookups never leave empty postings behind for removed terms
+    assert all(index._postings.values())
+    assert "heikin" not in index._postings
+
+
+def _touch(path, step):
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + step * 10**9))
+
+
+def test_broken_chapter_keeps_its_last_version_until_repaired(tmp_path, caplog):
+    folder = _tree(tmp_path)
+    index = SearchIndex(str(tmp_path))
+    index.refresh()
+    chapter = folder / "Chapter 1.py"
+    # A half-saved edit
+    chapter.write_text("import streamlit as st\nst.header('Candles'\n")
+    _touch(chapter, 1)
+    with caplog.at_level("WARNING", logger="core.search"):
+        index.refresh()
+        index.refresh()
+    assert len([r for r in caplog.records if "Chapter 1.py" in r.getMessage()]) == 1
+    assert [h["chapter"] for h in index.search("heikin")] == ["Chapter 1"]
+    assert [h["chapter"] for h in index.search("volume")] == ["Chapter 2"]
+
+    _write(chapter, "Candles", "Renko bricks")
+    _touch(chapter, 2)
+    index.refresh()
+    assert index.search("heikin") == []
+    assert [h["chapter"] for h in index.search("renko")] == ["Chapter 1"]
+
+
+def test_new_broken_chapter_is_skipped(tmp_path):
+    folder = _tree(tmp_path)
+    (folder / "Chapter 3.py").write_text("def (:\n")
+    index = SearchIndex(str(tmp_path))
+    index.refresh()
+    assert {h["chapter"] for h in index.search("trend")} == {"Chapter 1", "Chapter 2"}
+
+
+def test_search_while_another_thread_refreshes(tmp_path):
+    folder = _tree(tmp_path)
+    index = SearchIndex(str(tmp_path))
+    index.refresh()
+    errors = []
+    stop = threading.Event()
+
+    def rewrite():
+        for i in range(200):
+            _write(folder / "Chapter 2.py", "Volume", f"Volume confirms the trend term{i} extra{i}")
+            os.utime(folder / "Chapter 2.py", ns=(0, 10**18 + i))
+            index.refresh()
+        stop.set()
+
+    def query():
+        try:
+            while not stop.is_set():
+                index.search("t")
+                index.search("trend ter")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=rewrite)] + [threading.Thread(target=query) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert all(index._postings.values())
@@ -0,0 +1,104 @@
+import json
+import logging
+import types
+
+import pytest
+
+from core import timing
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(record.getMessage()))
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    """Fresh samples, spans off, no admin token and log lines captured in memory."""
+    monkeypatch.setattr(timing, "ENABLED", False)
+    monkeypatch.setattr(timing, "ADMIN_TOKEN", None)
+    monkeypatch.setattr(timing._local, "admin", False, raising=False)
+    timing._samples.clear()
+    handler = _Capture()
+    timing.logger.addHandler(handler)
+    monkeypatch.setattr(timing.logger, "level", logging.INFO)
+    yield handler
+    timing.logger.removeHandler(handler)
+    timing._samples.clear()
+
+
+def _fake_st(**params):
+    return types.SimpleNamespace(query_params=params)
+
+
+def test_span_is_a_shared_noop_while_off(spans):
+    assert timing.span("a") is timing.span("b")
+    with timing.span("a"):
+        pass
+    assert timing.summary() == [] and spans.lines == []
+
+
+def test_spans_are_recorded_per_chapter_and_logged(spans, monkeypatch):
+    monkeypatch.setattr(timing, "ENABLED", True)
+    with timing.chapter("Technical/Chapter 4"):
+        with timing.span("figure"):
+            pass
+    with timing.span("outside"):
+        pass
+    assert [(r["chapter"], r["span"], r["count"]) for r in timing.summary()] == [
+        ("-", "outside", 1), ("Technical/Chapter 4", "figure", 1)]
+    assert spans.lines[0]["chapter"] == "Technical/Chapter 4" and spans.lines[0]["span"] == "figure"
+
+
+def test_summary_percentiles_over_the_rolling_window(spans):
+    for ms in range(1, 101):
+        timing.record("load_module", ms / 1000)
+    row = timing.summary()[0]
+    assert row["count"] == 100
+    assert row["p50_ms"] == pytest.approx(51)
+    assert row["p95_ms"] == pytest.approx(95)
+    for _ in range(timing.WINDOW):
+        timing.record("load_module", 1.0)
+    row = timing.summary()[0]
+    assert row["count"] == timing.WINDOW and row["p50_ms"] == pytest.approx(1000)
+
+
+def test_percentile_picks_nearest_rank():
+    assert timing._percentile([1.0], 0.95) == 1.0
+    assert timing._percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.5) == 3.0
+    assert timing._percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.95) == 5.0
+
+
+def test_admin_panel_needs_a_configured_matching_token(spans, monkeypatch):
+    # No token configured: nothing the visitor passes turns spans on
+    for value in (None, "", "None"):
+        assert not timing.admin_requested(_fake_st(admin=value))
+        assert not timing.is_enabled()
+    monkeypatch.setattr(timing, "ADMIN_TOKEN", "s3cret")
+    assert not timing.admin_requested(_fake_st())
+    assert not timing.admin_requested(_fake_st(admin="wrong"))
+    assert timing.admin_requested(_fake_st(admin="s3cret"))
+    assert timing.is_enabled()
+    # The next run without the token turns them off again
+    assert not timing.admin_requested(_fake_st())
+    assert not timing.is_enabled()
+
+
+def test_instrument_wraps_once_and_times_only_while_on(spans, monkeypatch):
+    calls = []
+    owner = types.SimpleNamespace(plotly_chart=lambda fig: calls.append(fig) or "drawn")
+    timing.instrument(owner, "plotly_chart")
+    wrapped = owner.plotly_chart
+    timing.instrument(owner, "plotly_chart")
+    assert owner.plotly_chart is wrapped
+
+    assert owner.plotly_chart("fig") == "drawn"
+    assert timing.summary() == []
+    monkeypatch.setattr(timing, "ENABLED", True)
+    assert owner.plotly_chart("fig") == "drawn"
+    assert calls == ["fig", "fig"]
+    assert [(r["span"], r["count"]) for r in timing.summary()] == [("plotly_chart", 1)]
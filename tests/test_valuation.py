@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from core import valuation as val
+
+
+def _dcf_loop(revenue, shares, net_cash, growth, margin, discount, years, terminal_growth):
+    """Intrinsic value per share with every forecast year discounted explicitly."""
+    discount = max(discount, terminal_growth + 0.01)
+    fcf = revenue * margin
+    enterprise = 0.0
+    for t in range(1, years + 1):
+        fcf *= 1.0 + growth
+        enterprise += fcf / (1.0 + discount) ** t
+    terminal = fcf * (1.0 + terminal_growth) / (discount - terminal_growth)
+    enterprise += terminal / (1.0 + discount) ** years
+    return (enterprise + net_cash) / shares
+
+
+@pytest.mark.parametrize("growth, margin, discount", [
+    (0.06, 0.12, 0.09),
+    (0.09, 0.10, 0.09),   # growth == discount: the annuity ratio is exactly 1
+    (-0.05, 0.20, 0.11),
+    (0.04, 0.15, 0.02),   # discount below terminal growth is floored
+])
+def test_closed_form_matches_year_by_year_loop(growth, margin, discount):
+    got = val.intrinsic_values(1000.0, 50.0, -200.0, np.array([growth]), np.array([margin]),
+                               np.array([discount]), years=10, terminal_growth=0.025)
+    expected = _dcf_loop(1000.0, 50.0, -200.0, growth, margin, discount, 10, 0.025)
+    assert got[0] == pytest.approx(expected, rel=1e-10)
+
+
+def test_company_inputs_broadcast_against_paths():
+    rng = np.random.default_rng(0)
+    growth, margin, discount = val.draw_assumptions(rng, (3, 500))
+    revenue = np.array([100.0, 200.0, 300.0])
+    values = val.intrinsic_values(revenue, 10.0, 0.0, growth, margin, discount)
+    assert values.shape == (3, 500)
+    for i in range(3):
+        row = val.intrinsic_values(revenue[i], 10.0, 0.0, growth[i], margin[i], discount[i])
+        np.testing.assert_allclose(values[i], row)
+
+
+def test_simulate_summary_is_consistent():
+    result = val.simulate(1000.0, 50.0, 0.0, price=20.0, n_paths=20_000, seed=1)
+    pct = [result["percentiles"][p] for p in val.PERCENTILES]
+    assert pct == sorted(pct)
+    assert result["prob_undervalued"] == pytest.approx((result["values"] > 20.0).mean())
+    assert result["prob_undervalued"] + result["prob_overvalued"] <= 1.0
+
+
+def test_value_universe_is_reproducible_and_pool_independent(monkeypatch):
+    # A small block budget forces several chunks per batch
+    monkeypatch.setattr(val, "BLOCK_VALUES", 3 * 2_000)
+    kwargs = dict(revenue=np.linspace(100, 1000, 10), shares=50.0, net_cash=0.0, price=10.0,
+                  growth=0.05, margin=0.1, n_paths=2_000, seed=7, batch_size=4)
+    local = val.value_universe(max_workers=1, **kwargs)
+    pooled = val.value_universe(max_workers=2, **kwargs)
+    np.testing.assert_allclose(local["mean"], pooled["mean"])
+    assert local["mean"].shape == (10,)
+    # Value scales with revenue when everything else is equal
+    assert (np.diff(local["percentiles"][50]) > 0).all()